@@ -0,0 +1,416 @@
+import asyncio
+import os
+import random
+import time
+from dataclasses import dataclass, field
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from aiogram import Bot
+from aiogram.exceptions import (
+    TelegramAPIError,
+    TelegramBadRequest,
+    TelegramConflictError,
+    TelegramEntityTooLarge,
+    TelegramForbiddenError,
+    TelegramNetworkError,
+    TelegramNotFound,
+    TelegramRetryAfter,
+    TelegramServerError,
+    TelegramUnauthorizedError,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bot.core.repositories.delivery_repository import (
+    DELIVERY_FAILED,
+    DELIVERY_REJECTED,
+    DELIVERY_SENT,
+    DeliveryRepository,
+)
+from bot.core.repositories.user_repository import UserRepository
+from bot.keyboards import get_command_keyboard
+from bot.logger import setup_logger
+from bot.texts import EVENT_NOTIFICATION_TEXT
+from db.models import Event, User
+
+logger = setup_logger(__name__)
+
+# Глобальный лимит Telegram ~30 сообщений/с — держим запас
+BROADCAST_RATE = float(os.getenv("BROADCAST_RATE", "25"))
+BROADCAST_CONCURRENCY = int(os.getenv("BROADCAST_CONCURRENCY", "20"))
+BROADCAST_MAX_RETRIES = int(os.getenv("BROADCAST_MAX_RETRIES", "3"))
+# Размер страницы получателей, после которой прогресс фиксируется в БД
+BROADCAST_BATCH_SIZE = int(os.getenv("BROADCAST_BATCH_SIZE", "500"))
+# Не чаще одного сообщения в секунду в один чат
+BROADCAST_CHAT_INTERVAL = 1.0
+
+TRANSIENT_ERRORS = (TelegramNetworkError, TelegramServerError, asyncio.TimeoutError)
+
+
+class TokenBucket:
+    """Асинхронный token bucket: не более `rate` операций в секунду."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def pause(self, seconds: float):
+        """Останавливает выдачу токенов (например, после flood control)."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._tokens = 0
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+TELEGRAM_ERROR_CODES = {
+    TelegramBadRequest: 400,
+    TelegramUnauthorizedError: 401,
+    TelegramForbiddenError: 403,
+    TelegramNotFound: 404,
+    TelegramConflictError: 409,
+    TelegramEntityTooLarge: 413,
+    TelegramRetryAfter: 429,
+    TelegramServerError: 500,
+}
+
+
+def is_unreachable_error(error: Exception) -> bool:
+    """Бот заблокирован пользователем или чат больше не существует."""
+    if isinstance(error, TelegramForbiddenError):
+        return True
+    return (
+        isinstance(error, TelegramBadRequest) and "chat not found" in str(error).lower()
+    )
+
+
+def telegram_error_code(error: Exception) -> Optional[int]:
+    for cls in type(error).__mro__:
+        if cls in TELEGRAM_ERROR_CODES:
+            return TELEGRAM_ERROR_CODES[cls]
+    return None
+
+
+@dataclass
+class DeliveryResult:
+    chat_id: int
+    status: str
+    attempts: int
+    error_code: Optional[int] = None
+    unreachable: bool = False
+
+
+@dataclass
+class BroadcastStats:
+    sent: int = 0
+    failed: int = 0
+    rejected: int = 0
+    retried: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+    finished_at: Optional[float] = None
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        elapsed = self.elapsed
+        return self.sent / elapsed if elapsed > 0 else 0.0
+
+
+class Broadcaster:
+    """
+    Параллельная рассылка с соблюдением лимитов Telegram.
+
+    Отправки идут в `concurrency` потоков, общий темп ограничивается token bucket,
+    а сообщения в один чат — интервалом `chat_interval`. `TelegramRetryAfter`
+    приостанавливает всю рассылку, сетевые и серверные ошибки повторяются
+    с экспоненциальной задержкой.
+    """
+
+    def __init__(
+        self,
+        rate: float = BROADCAST_RATE,
+        concurrency: int = BROADCAST_CONCURRENCY,
+        max_retries: int = BROADCAST_MAX_RETRIES,
+        chat_interval: float = BROADCAST_CHAT_INTERVAL,
+    ):
+        self.bucket = TokenBucket(rate)
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.chat_interval = chat_interval
+        self._chat_last_sent: dict[int, float] = {}
+
+    async def _wait_for_chat(self, chat_id: int):
+        last = self._chat_last_sent.get(chat_id)
+        if last is not None:
+            delay = last + self.chat_interval - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        self._chat_last_sent[chat_id] = time.monotonic()
+
+    async def deliver(
+        self,
+        chat_id: int,
+        send: Callable[[int], Awaitable],
+        stats: BroadcastStats,
+    ) -> DeliveryResult:
+        """Отправляет одно сообщение с повторами."""
+        attempt = 0
+        while True:
+            await self.bucket.acquire()
+            await self._wait_for_chat(chat_id)
+            attempt += 1
+            try:
+                await send(chat_id)
+                stats.sent += 1
+                return DeliveryResult(chat_id, DELIVERY_SENT, attempt)
+            except TelegramRetryAfter as e:
+                logger.warning("Flood control: пауза %s с", e.retry_after)
+                self.bucket.pause(e.retry_after)
+                error = e
+            except TRANSIENT_ERRORS as e:
+                error = e
+            except TelegramAPIError as e:
+                logger.warning("Failed to send notification to user %s: %s", chat_id, e)
+                stats.rejected += 1
+                return DeliveryResult(
+                    chat_id,
+                    DELIVERY_REJECTED,
+                    attempt,
+                    telegram_error_code(e),
+                    unreachable=is_unreachable_error(e),
+                )
+            except Exception as e:
+                logger.error(
+                    "Unexpected error sending notification to user %s: %s", chat_id, e
+                )
+                stats.failed += 1
+                return DeliveryResult(chat_id, DELIVERY_FAILED, attempt)
+
+            if attempt > self.max_retries:
+                logger.warning(
+                    "Failed to send notification to user %s after %s attempts: %s",
+                    chat_id,
+                    attempt,
+                    error,
+                )
+                stats.failed += 1
+                return DeliveryResult(
+                    chat_id, DELIVERY_FAILED, attempt, telegram_error_code(error)
+                )
+            stats.retried += 1
+            if not isinstance(error, TelegramRetryAfter):
+                await asyncio.sleep(2 ** (attempt - 1) + random.random())
+
+    async def broadcast(
+        self,
+        chat_ids: Union[Iterable[int], AsyncIterable[int]],
+        send: Callable[[int], Awaitable],
+        on_result: Optional[Callable[[DeliveryResult], None]] = None,
+        stats: Optional[BroadcastStats] = None,
+    ) -> BroadcastStats:
+        """Рассылает сообщение всем `chat_ids`, вызывая `send(chat_id)`."""
+        stats = stats or BroadcastStats()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency * 2)
+
+        async def worker():
+            while True:
+                chat_id = await queue.get()
+                try:
+                    if chat_id is None:
+                        return
+                    result = await self.deliver(chat_id, send, stats)
+                    if on_result is not None:
+                        on_result(result)
+                finally:
+                    queue.task_done()
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.concurrency)]
+        try:
+            if hasattr(chat_ids, "__aiter__"):
+                async for chat_id in chat_ids:
+                    await queue.put(chat_id)
+            else:
+                for chat_id in chat_ids:
+                    await queue.put(chat_id)
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+            stats.finished_at = time.monotonic()
+        return stats
+
+
+def _pending_recipients(
+    session: AsyncSession,
+    broadcast_id: str,
+    batch_size: int,
+    chat_ids: Optional[Sequence[int]] = None,
+):
+    where = [
+        User.is_reachable.is_(True),
+        DeliveryRepository.is_pending(broadcast_id),
+    ]
+    if chat_ids is not None:
+        where.append(User.telegram_id.in_(chat_ids))
+    return UserRepository.iter_users(
+        session, batch_size=batch_size, columns=[User.telegram_id], where=where
+    )
+
+
+async def pending_recipient_pages(
+    session: AsyncSession,
+    broadcast_id: str,
+    batch_size: int = BROADCAST_BATCH_SIZE,
+) -> AsyncIterator[list[int]]:
+    """Страницы id получателей, которым рассылка ещё не доставлена."""
+    page: list[int] = []
+    async for user in _pending_recipients(session, broadcast_id, batch_size):
+        page.append(user.telegram_id)
+        if len(page) >= batch_size:
+            yield page
+            page = []
+    if page:
+        yield page
+
+
+async def run_checkpointed_broadcast(
+    session: AsyncSession,
+    broadcast_id: str,
+    send: Callable[[int], Awaitable],
+    batch_size: int = BROADCAST_BATCH_SIZE,
+    chat_ids: Optional[Sequence[int]] = None,
+    rate: float = BROADCAST_RATE,
+) -> BroadcastStats:
+    """
+    Рассылка с журналом доставки.
+
+    Получатели берутся страницами, исключая недоступных и уже доставленных
+    в рамках `broadcast_id`; результат каждой страницы фиксируется в журнале
+    до перехода к следующей. Повторный запуск продолжает рассылку с того же места.
+    Пользователи, заблокировавшие бота, помечаются недоступными.
+    `chat_ids` ограничивает рассылку частью получателей (для подзадач).
+    """
+    broadcaster = Broadcaster(rate=rate)
+    stats = BroadcastStats()
+    recipients = _pending_recipients(session, broadcast_id, batch_size, chat_ids)
+    page: list[int] = []
+
+    async def flush():
+        results: list[DeliveryResult] = []
+        await broadcaster.broadcast(page, send, on_result=results.append, stats=stats)
+        await DeliveryRepository.record_deliveries(session, broadcast_id, results)
+        await UserRepository.mark_unreachable(
+            session, [result.chat_id for result in results if result.unreachable]
+        )
+        page.clear()
+
+    # Страница рассылается и сохраняется до того, как итератор запросит следующую,
+    # поэтому сессия никогда не используется конкурентно
+    async for user in recipients:
+        page.append(user.telegram_id)
+        if len(page) >= batch_size:
+            await flush()
+    if page:
+        await flush()
+    logger.info(
+        "Broadcast %s finished: %s sent, %s failed, %s rejected, %s retried "
+        "in %.1fs (%.1f msg/s)",
+        broadcast_id,
+        stats.sent,
+        stats.failed,
+        stats.rejected,
+        stats.retried,
+        stats.elapsed,
+        stats.throughput,
+    )
+    return stats
+
+
+def event_broadcast_id(event_id: int, version: int = 1) -> str:
+    """
+    Журнал рассылки анонса для поколения события: после переноса анонс
+    с новой датой получают все, в том числе получившие прежний.
+    Первое поколение сохраняет прежний id, чтобы не потерять уже начатые журналы.
+    """
+    if version == 1:
+        return f"event:{event_id}"
+    return f"event:{event_id}:{version}"
+
+
+async def send_event_notifications(
+    bot: Bot,
+    event: Event,
+    session: AsyncSession,
+    chat_ids: Optional[Sequence[int]] = None,
+    rate: float = BROADCAST_RATE,
+) -> BroadcastStats:
+    """
+    Рассылает анонс события пользователям, которым он ещё не доставлен
+    (всем или только из `chat_ids`).
+    """
+    notification_text = EVENT_NOTIFICATION_TEXT.format(
+        name=event.name,
+        date=event.event_date.strftime("%d.%m.%Y"),
+        time=event.event_time.strftime("%H:%M"),
+        location=event.location_name or "Не указано",
+        description=event.description or "Не указано",
+        beer_options=(
+            f"{event.beer_option_1}, {event.beer_option_2}"
+            if event.has_beer_choice
+            else "Лагер"
+        ),
+    )
+    reply_markup = get_command_keyboard()
+
+    async def send(chat_id: int):
+        if event.image_file_id:
+            await bot.send_photo(
+                chat_id=chat_id,
+                photo=event.image_file_id,
+                caption=notification_text,
+                reply_markup=reply_markup,
+            )
+        else:
+            await bot.send_message(
+                chat_id=chat_id,
+                text=notification_text,
+                reply_markup=reply_markup,
+            )
+
+    return await run_checkpointed_broadcast(
+        session,
+        event_broadcast_id(event.id, event.version),
+        send,
+        chat_ids=chat_ids,
+        rate=rate,
+    )
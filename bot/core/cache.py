@@ -0,0 +1,242 @@
+import asyncio
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from aiogram import Bot
+from redis.asyncio import Redis
+
+from bot.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://redis:6379/0")
+INVALIDATION_CHANNEL = "cache:invalidate"
+
+T = TypeVar("T")
+
+_MISSING = object()
+_clients: dict[asyncio.AbstractEventLoop, Redis] = {}
+_caches: dict[str, Any] = {}
+
+
+def get_redis() -> Redis:
+    """Возвращает асинхронный клиент Redis для текущего цикла событий."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = Redis.from_url(REDIS_URL)
+        _clients[loop] = client
+    return client
+
+
+async def _publish_invalidation(namespace: str, keys: list[str]):
+    """Рассылает остальным процессам ключи, которые нужно сбросить локально."""
+    await get_redis().publish(
+        INVALIDATION_CHANNEL, json.dumps({"namespace": namespace, "keys": keys})
+    )
+
+
+class TwoTierCache:
+    """
+    Read-through кэш: LRU в памяти процесса поверх общего слоя в Redis.
+
+    Локальный TTL короче редисового: даже без подписки на инвалидацию процесс
+    увидит изменения не позже чем через `local_ttl` секунд. Значения в Redis
+    хранятся в JSON. Ошибки Redis не ломают чтение — запрос уходит в загрузчик.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl: int = 300,
+        local_ttl: int = 30,
+        maxsize: int = 10_000,
+    ):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.local_ttl = local_ttl
+        self.maxsize = maxsize
+        self._local: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        _caches[namespace] = self
+
+    def _redis_key(self, key: str) -> str:
+        return f"cache:{self.namespace}:{key}"
+
+    def _get_local(self, key: str) -> Any:
+        entry = self._local.get(key)
+        if entry is None:
+            return _MISSING
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._local[key]
+            return _MISSING
+        self._local.move_to_end(key)
+        return value
+
+    def _set_local(self, key: str, value: Any):
+        self._local[key] = (time.monotonic() + self.local_ttl, value)
+        self._local.move_to_end(key)
+        while len(self._local) > self.maxsize:
+            self._local.popitem(last=False)
+
+    def drop_local(self, *keys: str):
+        for key in keys:
+            self._local.pop(key, None)
+
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable[T]]) -> T:
+        value = self._get_local(key)
+        if value is not _MISSING:
+            return value
+        try:
+            raw = await get_redis().get(self._redis_key(key))
+            if raw is not None:
+                value = json.loads(raw)
+                self._set_local(key, value)
+                return value
+        except Exception as e:
+            logger.warning(f"Redis недоступен для кэша {self.namespace}: {e}")
+        value = await loader()
+        self._set_local(key, value)
+        try:
+            await get_redis().set(
+                self._redis_key(key), json.dumps(value, default=str), ex=self.ttl
+            )
+        except Exception as e:
+            logger.warning(f"Не удалось записать кэш {self.namespace}:{key}: {e}")
+        return value
+
+    async def invalidate(self, *keys: str):
+        """Удаляет ключи локально, в Redis и в памяти остальных процессов."""
+        self.drop_local(*keys)
+        if not keys:
+            return
+        try:
+            await get_redis().delete(*(self._redis_key(key) for key in keys))
+            await _publish_invalidation(self.namespace, list(keys))
+        except Exception as e:
+            logger.warning(f"Не удалось инвалидировать кэш {self.namespace}: {e}")
+
+
+class LocalSnapshot:
+    """
+    Снимок данных в памяти процесса для горячих чтений.
+
+    Обновляется не чаще раза в `ttl` секунд одной корутиной — остальные ждут
+    её результата. `is_stale` позволяет признать снимок устаревшим досрочно.
+    Инвалидация рассылается остальным процессам через pub/sub.
+    """
+
+    def __init__(self, namespace: str, ttl: float = 30):
+        self.namespace = namespace
+        self.ttl = ttl
+        self._value: Any = _MISSING
+        self._expires_at = 0.0
+        self._generation = 0
+        self._lock = asyncio.Lock()
+        _caches[namespace] = self
+
+    def _fresh(self, is_stale: Optional[Callable[[Any], bool]]) -> bool:
+        if self._value is _MISSING or self._expires_at < time.monotonic():
+            return False
+        return is_stale is None or not is_stale(self._value)
+
+    def drop_local(self, *keys: str):
+        self._value = _MISSING
+        self._generation += 1
+
+    async def get(
+        self,
+        loader: Callable[[], Awaitable[T]],
+        is_stale: Optional[Callable[[T], bool]] = None,
+    ) -> T:
+        if self._fresh(is_stale):
+            return self._value
+        async with self._lock:
+            if self._fresh(is_stale):
+                return self._value
+            generation = self._generation
+            value = await loader()
+            # Снимок, сброшенный во время загрузки, не сохраняем
+            if generation == self._generation:
+                self._value = value
+                self._expires_at = time.monotonic() + self.ttl
+            return value
+
+    async def invalidate(self):
+        self.drop_local()
+        try:
+            await _publish_invalidation(self.namespace, [])
+        except Exception as e:
+            logger.warning(f"Не удалось инвалидировать снимок {self.namespace}: {e}")
+
+
+class ChatMemberCache:
+    """
+    Статусы участников чатов (chat_id, user_id) в памяти процесса.
+
+    Записи живут `ttl` секунд и обновляются обработчиками `my_chat_member`
+    и `chat_member`, так что повторные проверки не ходят в Telegram.
+    """
+
+    def __init__(self, ttl: int = 300, maxsize: int = 10_000):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._statuses: OrderedDict[tuple[int, int], tuple[float, str]] = OrderedDict()
+
+    def set_status(self, chat_id: int, user_id: int, status: str):
+        key = (chat_id, user_id)
+        self._statuses[key] = (time.monotonic() + self.ttl, status)
+        self._statuses.move_to_end(key)
+        while len(self._statuses) > self.maxsize:
+            self._statuses.popitem(last=False)
+
+    def invalidate(self, chat_id: int, user_id: Optional[int] = None):
+        if user_id is not None:
+            self._statuses.pop((chat_id, user_id), None)
+            return
+        for key in [key for key in self._statuses if key[0] == chat_id]:
+            del self._statuses[key]
+
+    async def get_status(self, bot: Bot, chat_id: int, user_id: int) -> str:
+        key = (chat_id, user_id)
+        entry = self._statuses.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        member = await bot.get_chat_member(chat_id=chat_id, user_id=user_id)
+        self.set_status(chat_id, user_id, member.status)
+        return member.status
+
+
+chat_member_cache = ChatMemberCache()
+
+
+async def listen_invalidations():
+    """Слушает pub/sub-канал инвалидации и сбрасывает локальные копии ключей."""
+    while True:
+        pubsub = get_redis().pubsub()
+        try:
+            await pubsub.subscribe(INVALIDATION_CHANNEL)
+            logger.info("Подписка на инвалидацию кэшей активна")
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                payload = json.loads(message["data"])
+                cache = _caches.get(payload.get("namespace"))
+                if cache is not None:
+                    cache.drop_local(*payload.get("keys", []))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Подписка на инвалидацию кэшей прервана: {e}")
+            await asyncio.sleep(5)
+        finally:
+            await pubsub.aclose()
+
+
+async def close_redis():
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
@@ -1,10 +1,11 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, insert, func
-from db.models import BeerSelection, Event
+from sqlalchemy import select, delete, exists, func, and_, literal, text
+from sqlalchemy.orm import aliased
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from db.models import BeerSelection, EventBeerCounter
 from db.schemas import BeerSelectionCreate
 from bot.logger import setup_logger
-from typing import List, Optional, Dict, Tuple
-import pendulum
+from typing import Optional
 
 logger = setup_logger(__name__)
 
@@ -13,21 +14,49 @@ class BeerRepository:
     @staticmethod
     async def create_beer_selection(
         session: AsyncSession, selection_data: BeerSelectionCreate
-    ) -> BeerSelection:
-        """Создаёт запись о выборе пива."""
+    ) -> Optional[BeerSelection]:
+        """
+        Создаёт запись о выборе пива и увеличивает счётчик заказов одним запросом.
+        Если пользователь уже выбирал пиво для события, возвращает None.
+        """
         try:
-            logger.info(
-                f"Creating beer selection for user_id={selection_data.user_id}, event_id={selection_data.event_id}"
+            logger.debug(
+                "Creating beer selection for user_id=%s, event_id=%s",
+                selection_data.user_id,
+                selection_data.event_id,
             )
-            stmt = (
-                insert(BeerSelection)
+            inserted = (
+                pg_insert(BeerSelection)
                 .values(**selection_data.dict())
+                .on_conflict_do_nothing(
+                    index_elements=[BeerSelection.user_id, BeerSelection.event_id]
+                )
                 .returning(BeerSelection)
+                .cte("inserted")
+            )
+            bump = pg_insert(EventBeerCounter).from_select(
+                ["event_id", "beer_choice", "quantity"],
+                select(inserted.c.event_id, inserted.c.beer_choice, literal(1)),
             )
+            bump = bump.on_conflict_do_update(
+                index_elements=[
+                    EventBeerCounter.event_id,
+                    EventBeerCounter.beer_choice,
+                ],
+                set_={"quantity": EventBeerCounter.quantity + bump.excluded.quantity},
+            ).cte("bumped")
+            stmt = select(aliased(BeerSelection, inserted)).add_cte(bump)
             result = await session.execute(stmt)
-            selection = result.scalar_one()
+            selection = result.scalar_one_or_none()
             await session.commit()
-            logger.info(f"Created beer selection id={selection.id}")
+            if selection is None:
+                logger.info(
+                    "Beer selection already exists for user_id=%s, event_id=%s",
+                    selection_data.user_id,
+                    selection_data.event_id,
+                )
+            else:
+                logger.info("Created beer selection id=%s", selection.id)
             return selection
         except Exception as e:
             logger.error(f"Error creating beer selection: {e}", exc_info=True)
@@ -41,7 +70,7 @@ class BeerRepository:
         """Проверяет, сделал ли пользователь выбор пива для события."""
         try:
             logger.debug(
-                f"Checking beer selection for user_id={user_id}, event_id={event_id}"
+                "Checking beer selection for user_id=%s, event_id=%s", user_id, event_id
             )
             stmt = select(BeerSelection).where(
                 BeerSelection.user_id == user_id, BeerSelection.event_id == event_id
@@ -49,98 +78,117 @@ class BeerRepository:
             result = await session.execute(stmt)
             selection = result.scalar_one_or_none()
             if selection:
-                logger.debug(f"Found beer selection id={selection.id}")
+                logger.debug("Found beer selection id=%s", selection.id)
             else:
-                logger.debug(f"No beer selection found")
+                logger.debug("No beer selection found")
             return selection
         except Exception as e:
             logger.error(f"Error checking beer selection: {e}", exc_info=True)
             raise
 
     @staticmethod
-    async def get_beer_stats(session: AsyncSession, user_id: int) -> Dict[str, int]:
+    async def get_event_beer_orders(session: AsyncSession, event_id: int) -> dict:
+        """Получает статистику заказов пива для события из счётчиков."""
         try:
-            logger.debug(f"Fetching beer stats for user_id={user_id}")
-            stmt = (
-                select(BeerSelection.beer_choice, func.count(BeerSelection.beer_choice))
-                .where(BeerSelection.user_id == user_id)
-                .group_by(BeerSelection.beer_choice)
+            stmt = select(
+                EventBeerCounter.beer_choice, EventBeerCounter.quantity
+            ).where(
+                EventBeerCounter.event_id == event_id, EventBeerCounter.quantity > 0
             )
             result = await session.execute(stmt)
-            stats = {row[0]: row[1] for row in result.all()}
-            logger.info(f"Fetched beer stats for user_id={user_id}: {stats}")
-            return stats
-        except Exception as e:
-            logger.error(f"Error fetching beer stats: {e}", exc_info=True)
-            raise
+            beer_orders = {row[0]: row[1] for row in result.all()}
+            # Один выбор на пользователя в событии — участников столько же, сколько заказов
+            participants = sum(beer_orders.values())
 
-    @staticmethod
-    async def get_last_beer_choice(
-        session: AsyncSession, user_id: int
-    ) -> Optional[Tuple[str, str, str]]:
-        try:
-            logger.debug(f"Fetching last beer choice for user_id={user_id}")
-            stmt = (
-                select(
-                    BeerSelection.beer_choice,
-                    Event.name,
-                    Event.event_date,
-                    Event.event_time,
-                )
-                .join(Event, BeerSelection.event_id == Event.id)
-                .where(BeerSelection.user_id == user_id)
-                .order_by(BeerSelection.selected_at.desc())
-                .limit(1)
+            logger.info(
+                "Статистика заказов для event_id=%s: participants=%s, orders=%s",
+                event_id,
+                participants,
+                beer_orders,
             )
-            result = await session.execute(stmt)
-            row = result.first()
-            if row:
-                beer_choice, event_name, event_date, event_time = row
-                event_datetime = pendulum.datetime(
-                    event_date.year,
-                    event_date.month,
-                    event_date.day,
-                    event_time.hour,
-                    event_time.minute,
-                    tz="Europe/Moscow",
-                ).format("DD.MM.YYYY HH:mm")
-                logger.debug(
-                    f"Found last beer choice for user_id={user_id}: {beer_choice} at {event_name}"
-                )
-                return beer_choice, event_name, event_datetime
-            logger.debug(f"No last beer choice found for user_id={user_id}")
-            return None
+            return {"participants": participants, "beer_orders": beer_orders}
         except Exception as e:
-            logger.error(f"Error fetching last beer choice: {e}", exc_info=True)
+            logger.error(
+                f"Ошибка при получении статистики заказов для event_id={event_id}: {e}",
+                exc_info=True,
+            )
             raise
 
     @staticmethod
-    async def get_event_beer_orders(session: AsyncSession, event_id: int) -> dict:
-        """Получает статистику заказов пива для события."""
+    async def counters_need_backfill(session: AsyncSession) -> bool:
+        """True, если выборы есть, а счётчики ещё ни разу не заполнялись."""
+        stmt = select(
+            exists().where(BeerSelection.id.isnot(None)),
+            exists().where(EventBeerCounter.event_id.isnot(None)),
+        )
+        has_selections, has_counters = (await session.execute(stmt)).one()
+        return has_selections and not has_counters
+
+    @staticmethod
+    async def reconcile_beer_counters(
+        session: AsyncSession, event_id: Optional[int] = None
+    ) -> int:
+        """
+        Пересчитывает счётчики заказов по исходным выборам и исправляет расхождения.
+        Возвращает количество исправленных счётчиков.
+
+        На время сверки таблица счётчиков блокируется от записи: иначе выбор,
+        зафиксированный между подсчётом и upsert, был бы затёрт устаревшим
+        количеством. Новые выборы ждут окончания сверки.
+        """
         try:
-            # Подсчёт участников (уникальных user_id)
-            stmt = select(func.count(func.distinct(BeerSelection.user_id))).where(
-                BeerSelection.event_id == event_id
+            await session.execute(
+                text(
+                    f"LOCK TABLE {EventBeerCounter.__table__.fullname} "
+                    "IN SHARE ROW EXCLUSIVE MODE"
+                )
             )
-            result = await session.execute(stmt)
-            participants = result.scalar_one()
+            actual = select(
+                BeerSelection.event_id,
+                BeerSelection.beer_choice,
+                func.count().label("quantity"),
+            ).group_by(BeerSelection.event_id, BeerSelection.beer_choice)
+            if event_id is not None:
+                actual = actual.where(BeerSelection.event_id == event_id)
 
-            # Подсчёт заказов по типам пива
-            stmt = (
-                select(BeerSelection.beer_choice, func.count())
-                .where(BeerSelection.event_id == event_id)
-                .group_by(BeerSelection.beer_choice)
+            upsert = pg_insert(EventBeerCounter).from_select(
+                ["event_id", "beer_choice", "quantity"], actual
             )
-            result = await session.execute(stmt)
-            beer_orders = {row[0]: row[1] for row in result.all()}
+            upsert = upsert.on_conflict_do_update(
+                index_elements=[
+                    EventBeerCounter.event_id,
+                    EventBeerCounter.beer_choice,
+                ],
+                set_={"quantity": upsert.excluded.quantity},
+                where=EventBeerCounter.quantity != upsert.excluded.quantity,
+            )
+            updated = (await session.execute(upsert)).rowcount
 
-            logger.info(
-                f"Статистика заказов для event_id={event_id}: participants={participants}, orders={beer_orders}"
+            # Счётчики, для которых не осталось ни одного выбора
+            orphaned = delete(EventBeerCounter).where(
+                ~select(BeerSelection.id)
+                .where(
+                    and_(
+                        BeerSelection.event_id == EventBeerCounter.event_id,
+                        BeerSelection.beer_choice == EventBeerCounter.beer_choice,
+                    )
+                )
+                .exists()
             )
-            return {"participants": participants, "beer_orders": beer_orders}
+            if event_id is not None:
+                orphaned = orphaned.where(EventBeerCounter.event_id == event_id)
+            removed = (await session.execute(orphaned)).rowcount
+
+            await session.commit()
+            fixed = updated + removed
+            if fixed:
+                logger.warning(
+                    f"Исправлено счётчиков заказов: {fixed} (обновлено {updated}, удалено {removed})"
+                )
+            else:
+                logger.info("Счётчики заказов совпадают с выборами")
+            return fixed
         except Exception as e:
-            logger.error(
-                f"Ошибка при получении статистики заказов для event_id={event_id}: {e}",
-                exc_info=True,
-            )
+            logger.error(f"Ошибка сверки счётчиков заказов: {e}", exc_info=True)
+            await session.rollback()
             raise
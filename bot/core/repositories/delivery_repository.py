@@ -0,0 +1,93 @@
+from typing import Dict, Sequence
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, exists, func
+from sqlalchemy.dialects.postgresql import insert
+from db.models import BroadcastDelivery, User
+from bot.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+DELIVERY_SENT = "sent"
+# Временная ошибка — получатель будет повторён при возобновлении рассылки
+DELIVERY_FAILED = "failed"
+# Постоянная ошибка Telegram (бот заблокирован, чат не найден и т. п.)
+DELIVERY_REJECTED = "rejected"
+# Статусы, после которых получатель больше не нуждается в отправке
+FINAL_STATUSES = (DELIVERY_SENT, DELIVERY_REJECTED)
+
+
+class DeliveryRepository:
+    @staticmethod
+    def is_pending(broadcast_id: str):
+        """Условие для выборки пользователей, которым рассылка ещё не доставлена."""
+        return ~exists().where(
+            BroadcastDelivery.broadcast_id == broadcast_id,
+            BroadcastDelivery.user_id == User.telegram_id,
+            BroadcastDelivery.status.in_(FINAL_STATUSES),
+        )
+
+    @staticmethod
+    async def record_deliveries(
+        session: AsyncSession, broadcast_id: str, results: Sequence
+    ) -> None:
+        """Сохраняет результаты отправки страницы получателей одним запросом."""
+        if not results:
+            return
+        try:
+            stmt = insert(BroadcastDelivery).values(
+                [
+                    {
+                        "broadcast_id": broadcast_id,
+                        "user_id": result.chat_id,
+                        "status": result.status,
+                        "attempts": result.attempts,
+                        "error_code": result.error_code,
+                    }
+                    for result in results
+                ]
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[
+                    BroadcastDelivery.broadcast_id,
+                    BroadcastDelivery.user_id,
+                ],
+                set_={
+                    "status": stmt.excluded.status,
+                    "attempts": BroadcastDelivery.attempts + stmt.excluded.attempts,
+                    "error_code": stmt.excluded.error_code,
+                    "updated_at": func.now(),
+                },
+            )
+            await session.execute(stmt)
+            await session.commit()
+            logger.debug(
+                "Checkpoint рассылки %s: сохранено %s результатов",
+                broadcast_id,
+                len(results),
+            )
+        except Exception as e:
+            logger.error(
+                f"Ошибка сохранения журнала рассылки {broadcast_id}: {e}", exc_info=True
+            )
+            await session.rollback()
+            raise
+
+    @staticmethod
+    async def get_delivery_stats(
+        session: AsyncSession, broadcast_id: str
+    ) -> Dict[str, int]:
+        """Возвращает количество получателей рассылки по статусам."""
+        try:
+            stmt = (
+                select(BroadcastDelivery.status, func.count())
+                .where(BroadcastDelivery.broadcast_id == broadcast_id)
+                .group_by(BroadcastDelivery.status)
+            )
+            result = await session.execute(stmt)
+            return {row[0]: row[1] for row in result.all()}
+        except Exception as e:
+            logger.error(
+                f"Ошибка получения статистики рассылки {broadcast_id}: {e}",
+                exc_info=True,
+            )
+            raise
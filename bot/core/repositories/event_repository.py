@@ -1,29 +1,158 @@
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, update
 from db.models import Event
 from db.schemas import EventCreate
 from bot.logger import setup_logger
-from datetime import date
+from bot.core.cache import LocalSnapshot, get_redis
+from bot.core.repositories.scheduled_job_repository import ScheduledJobRepository
+from datetime import date, datetime, time, timedelta
 import pendulum
 
 logger = setup_logger(__name__)
 
+# Список предстоящих событий для /beer; сбрасывается при создании и удалении событий
+upcoming_events_snapshot = LocalSnapshot("upcoming_events", ttl=30)
+
+# Поколение события в Redis: задачи сверяют его до обращения к БД.
+# 0 — событие удалено.
+EVENT_GENERATION_TTL = 60 * 60 * 24 * 60
+EVENT_DELETED = 0
+
+BARTENDER_NOTIFICATION_TASK = (
+    "bot.tasks.bartender_notification.process_bartender_notification"
+)
+USER_NOTIFICATION_TASK = "bot.tasks.bartender_notification.process_user_notification"
+# Анонс перенесённого события уходит не позже чем за это время до начала
+USER_NOTIFICATION_LEAD = timedelta(hours=1)
+
+
+def _generation_key(event_id: int) -> str:
+    return f"event:{event_id}:generation"
+
+
+async def set_event_generation(event_id: int, version: int):
+    try:
+        await get_redis().set(
+            _generation_key(event_id), version, ex=EVENT_GENERATION_TTL
+        )
+    except Exception as e:
+        logger.warning(f"Не удалось сохранить поколение события {event_id}: {e}")
+
+
+async def get_event_generation(event_id: int) -> Optional[int]:
+    """Поколение события из Redis или None, если оно неизвестно."""
+    try:
+        value = await get_redis().get(_generation_key(event_id))
+    except Exception as e:
+        logger.warning(f"Не удалось прочитать поколение события {event_id}: {e}")
+        return None
+    return int(value) if value is not None else None
+
 
 class EventRepository:
+    @staticmethod
+    def compute_starts_at(event_date: date, event_time: time) -> datetime:
+        """Момент начала события по московскому времени."""
+        return pendulum.datetime(
+            event_date.year,
+            event_date.month,
+            event_date.day,
+            event_time.hour,
+            event_time.minute,
+            tz="Europe/Moscow",
+        )
+
     @staticmethod
     async def create_event(session: AsyncSession, event_data: EventCreate) -> Event:
         try:
             event = Event(**event_data.model_dump())
+            event.starts_at = EventRepository.compute_starts_at(
+                event.event_date, event.event_time
+            )
             session.add(event)
             await session.commit()
             await session.refresh(event)
+            await upcoming_events_snapshot.invalidate()
             return event
         except Exception as e:
             logger.error(f"Ошибка создания события: {e}", exc_info=True)
             await session.rollback()
             raise
 
+    @staticmethod
+    async def reschedule_event(
+        session: AsyncSession, event_id: int, event_date: date, event_time: time
+    ) -> Optional[Event]:
+        """
+        Переносит событие: увеличивает его поколение, отменяет незапущенные
+        задачи и планирует их заново. Уведомление бармена — к новому началу,
+        анонс — на прежнее время, но не позже чем за USER_NOTIFICATION_LEAD
+        до начала.
+        """
+        try:
+            starts_at = EventRepository.compute_starts_at(event_date, event_time)
+            stmt = (
+                update(Event)
+                .where(Event.id == event_id)
+                .values(
+                    event_date=event_date,
+                    event_time=event_time,
+                    starts_at=starts_at,
+                    version=Event.version + 1,
+                )
+                .returning(Event)
+            )
+            result = await session.execute(stmt)
+            event = result.scalar_one_or_none()
+            if event is None:
+                return None
+
+            await ScheduledJobRepository.cancel_event_jobs(session, event_id)
+            now = pendulum.now("Europe/Moscow")
+            task_ids = {}
+            if starts_at > now:
+                bartender_job = ScheduledJobRepository.add_job(
+                    session,
+                    BARTENDER_NOTIFICATION_TASK,
+                    (event_id, event.version),
+                    due_at=starts_at,
+                    event_id=event_id,
+                )
+                task_ids["bartender_task_id"] = bartender_job.task_id
+            if event.celery_task_id:
+                # Задачи старого поколения (и ещё не отработавшие подзадачи
+                # рассылки) будут отброшены, поэтому анонс планируется заново.
+                # У нового поколения свой журнал рассылки — анонс с новой датой
+                # получат все, включая получивших прежний
+                due_at = await ScheduledJobRepository.get_job_due_at(
+                    session, event.celery_task_id
+                )
+                due_at = min(due_at or now, starts_at - USER_NOTIFICATION_LEAD)
+                user_job = ScheduledJobRepository.add_job(
+                    session,
+                    USER_NOTIFICATION_TASK,
+                    (event_id, event.version),
+                    due_at=max(due_at, now),
+                    event_id=event_id,
+                )
+                task_ids["celery_task_id"] = user_job.task_id
+            if task_ids:
+                await session.execute(
+                    update(Event).where(Event.id == event_id).values(**task_ids)
+                )
+            await session.commit()
+            await set_event_generation(event_id, event.version)
+            await upcoming_events_snapshot.invalidate()
+            logger.info(
+                f"Событие {event_id} перенесено на {starts_at}, поколение {event.version}"
+            )
+            return event
+        except Exception as e:
+            logger.error(f"Ошибка переноса события {event_id}: {e}", exc_info=True)
+            await session.rollback()
+            raise
+
     @staticmethod
     async def get_event_by_id(session: AsyncSession, event_id: int) -> Optional[Event]:
         try:
@@ -81,12 +210,39 @@ class EventRepository:
             logger.error(f"Ошибка получения предстоящих событий: {e}", exc_info=True)
             raise
 
+    @staticmethod
+    async def get_startable_events(
+        session: AsyncSession,
+        now: Optional[datetime] = None,
+        window: Optional[timedelta] = None,
+        limit: int = 100,
+        chat_id: Optional[int] = None,
+    ) -> List[Event]:
+        """
+        Возвращает ещё не начавшиеся события по возрастанию времени начала.
+        Если задан `window`, только те, что начнутся не позже чем через `window`;
+        если задан `chat_id` — только события этой группы.
+        """
+        try:
+            now = now or pendulum.now("Europe/Moscow")
+            stmt = select(Event).where(Event.starts_at > now)
+            if window is not None:
+                stmt = stmt.where(Event.starts_at <= now + window)
+            if chat_id is not None:
+                stmt = stmt.where(Event.chat_id == chat_id)
+            stmt = stmt.order_by(Event.starts_at.asc()).limit(limit)
+            result = await session.execute(stmt)
+            return list(result.scalars().all())
+        except Exception as e:
+            logger.error(f"Ошибка получения начинающихся событий: {e}", exc_info=True)
+            raise
+
     @staticmethod
     async def get_upcoming_events_by_date(
         session: AsyncSession, date: date, limit: int = 100
     ) -> List[Event]:
         try:
-            logger.debug(f"Fetching upcoming events for date={date}, limit={limit}")
+            logger.debug("Fetching upcoming events for date=%s, limit=%s", date, limit)
             stmt = (
                 select(Event)
                 .where(Event.event_date == date)
@@ -95,7 +251,7 @@ class EventRepository:
             )
             result = await session.execute(stmt)
             events = result.scalars().all()
-            logger.info(f"Fetched {len(events)} events for date={date}")
+            logger.debug("Fetched %s events for date=%s", len(events), date)
             return list(events)
         except Exception as e:
             logger.error(f"Error fetching events for date={date}: {e}", exc_info=True)
@@ -103,10 +259,16 @@ class EventRepository:
 
     @staticmethod
     async def delete_event(session: AsyncSession, event_id: int) -> bool:
+        """
+        Удаляет событие. Незапущенные задачи удаляются каскадно, а уже
+        поставленные в очередь увидят в Redis, что событие удалено.
+        """
         try:
             stmt = delete(Event).where(Event.id == event_id)
             result = await session.execute(stmt)
             await session.commit()
+            await set_event_generation(event_id, EVENT_DELETED)
+            await upcoming_events_snapshot.invalidate()
             return result.rowcount is not None and result.rowcount > 0
         except Exception as e:
             logger.error(f"Ошибка удаления события {event_id}: {e}", exc_info=True)
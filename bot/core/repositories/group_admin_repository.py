@@ -1,53 +1,55 @@
 from typing import Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete, insert, func
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import select, delete, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from db.models import GroupAdmin
 from db.schemas import GroupAdminCreate
+from bot.core.cache import TwoTierCache
 from bot.logger import setup_logger
+import pendulum
 
 logger = setup_logger(__name__)
 
+# Админы групп меняются только в join.on_my_chat_member — читаем из кэша
+group_admin_cache = TwoTierCache("group_admin", ttl=600, local_ttl=60)
+
+
+def group_admin_cache_keys(chat_id: int, user_id: Optional[int] = None) -> List[str]:
+    keys = [f"exists:{chat_id}"]
+    if user_id is not None:
+        keys += [f"admin_chat:{user_id}", f"user_chats:{user_id}"]
+    return keys
+
+
+async def invalidate_group_admin_cache(chat_id: int, user_id: Optional[int] = None):
+    await group_admin_cache.invalidate(*group_admin_cache_keys(chat_id, user_id))
+
 
 class GroupAdminRepository:
     @staticmethod
     async def create_group_admin(
         session: AsyncSession, group_admin_data: GroupAdminCreate
     ) -> GroupAdmin:
-        """Создает новую запись администратора группы в базе данных."""
+        """Создает запись администратора группы или возвращает существующую."""
         chat_id = group_admin_data.chat_id
-        user_id = group_admin_data.user_id
         try:
-            # Проверяем, существует ли запись
-            if await GroupAdminRepository.group_admin_exists(session, chat_id):
-                logger.info(f"Запись для группы chat_id={chat_id} уже существует")
-                return await GroupAdminRepository.get_group_admin_by_chat_id(
-                    session, chat_id
-                )
-
-            stmt = (
-                insert(GroupAdmin)
-                .values(**group_admin_data.model_dump())
-                .returning(GroupAdmin)
-            )
+            stmt = pg_insert(GroupAdmin).values(**group_admin_data.model_dump())
+            # Конфликт по chat_id сохраняет прежнего администратора; пустое обновление
+            # нужно, чтобы RETURNING вернул и уже существующую строку
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[GroupAdmin.chat_id],
+                set_={"user_id": GroupAdmin.user_id},
+            ).returning(GroupAdmin)
             result = await session.execute(stmt)
             group_admin = result.scalar_one()
             await session.commit()
+            await invalidate_group_admin_cache(chat_id, group_admin.user_id)
             logger.info(
-                f"Создан администратор группы: chat_id={group_admin.chat_id}, user_id={group_admin.user_id}"
+                "Администратор группы сохранён: chat_id=%s, user_id=%s",
+                group_admin.chat_id,
+                group_admin.user_id,
             )
             return group_admin
-        except IntegrityError as e:
-            logger.warning(
-                f"Повторная попытка создания записи для chat_id={chat_id}: {e}"
-            )
-            await session.rollback()
-            existing_admin = await GroupAdminRepository.get_group_admin_by_chat_id(
-                session, chat_id
-            )
-            if existing_admin:
-                return existing_admin
-            raise
         except Exception as e:
             logger.error(
                 f"Ошибка при создании администратора группы для chat_id={chat_id}: {e}",
@@ -66,11 +68,13 @@ class GroupAdminRepository:
             result = await session.execute(stmt)
             group_admin = result.scalar_one_or_none()
             if group_admin:
-                logger.info(
-                    f"Найден администратор для группы {chat_id}: user_id={group_admin.user_id}"
+                logger.debug(
+                    "Найден администратор для группы %s: user_id=%s",
+                    chat_id,
+                    group_admin.user_id,
                 )
             else:
-                logger.info(f"Администратор для группы {chat_id} не найден")
+                logger.debug("Администратор для группы %s не найден", chat_id)
             return group_admin
         except Exception as e:
             logger.error(
@@ -84,31 +88,62 @@ class GroupAdminRepository:
         session: AsyncSession, user_id: int
     ) -> List[GroupAdmin]:
         """Получает все записи администраторов групп для указанного user_id."""
-        try:
-            stmt = select(GroupAdmin).where(GroupAdmin.user_id == user_id)
-            result = await session.execute(stmt)
-            group_admins = result.scalars().all()
-            logger.info(
-                f"Найдено {len(group_admins)} групп для администратора user_id={user_id}"
-            )
-            return list(group_admins)
-        except Exception as e:
-            logger.error(
-                f"Ошибка при получении групп для администратора user_id={user_id}: {e}",
-                exc_info=True,
-            )
-            raise
+
+        async def load() -> list:
+            try:
+                stmt = select(GroupAdmin).where(GroupAdmin.user_id == user_id)
+                result = await session.execute(stmt)
+                group_admins = result.scalars().all()
+                logger.debug(
+                    "Найдено %s групп для администратора user_id=%s",
+                    len(group_admins),
+                    user_id,
+                )
+                return [
+                    {
+                        "chat_id": admin.chat_id,
+                        "user_id": admin.user_id,
+                        "added_at": (
+                            admin.added_at.isoformat() if admin.added_at else None
+                        ),
+                    }
+                    for admin in group_admins
+                ]
+            except Exception as e:
+                logger.error(
+                    f"Ошибка при получении групп для администратора user_id={user_id}: {e}",
+                    exc_info=True,
+                )
+                raise
+
+        rows = await group_admin_cache.get_or_load(f"user_chats:{user_id}", load)
+        return [
+            GroupAdmin(
+                chat_id=row["chat_id"],
+                user_id=row["user_id"],
+                added_at=pendulum.parse(row["added_at"]) if row["added_at"] else None,
+            )
+            for row in rows
+        ]
 
     @staticmethod
     async def delete_group_admin(session: AsyncSession, chat_id: int) -> bool:
         """Удаляет запись администратора группы по chat_id."""
         try:
-            stmt = delete(GroupAdmin).where(GroupAdmin.chat_id == chat_id)
+            stmt = (
+                delete(GroupAdmin)
+                .where(GroupAdmin.chat_id == chat_id)
+                .returning(GroupAdmin.user_id)
+            )
             result = await session.execute(stmt)
+            user_id = result.scalar_one_or_none()
             await session.commit()
-            success = result.rowcount is not None and result.rowcount > 0
+            success = user_id is not None
+            await invalidate_group_admin_cache(chat_id, user_id)
             logger.info(
-                f"Удаление администратора группы {chat_id}: {'успешно' if success else 'не найдено'}"
+                "Удаление администратора группы %s: %s",
+                chat_id,
+                "успешно" if success else "не найдено",
             )
             return success
         except Exception as e:
@@ -122,34 +157,42 @@ class GroupAdminRepository:
     @staticmethod
     async def group_admin_exists(session: AsyncSession, chat_id: int) -> bool:
         """Проверяет, существует ли запись администратора группы по chat_id."""
-        try:
-            stmt = select(func.count(GroupAdmin.chat_id)).where(
-                GroupAdmin.chat_id == chat_id
-            )
-            result = await session.execute(stmt)
-            count = result.scalar_one()
-            exists = count > 0
-            logger.info(
-                f"Проверка существования группы {chat_id}: {'существует' if exists else 'не существует'}"
-            )
-            return exists
-        except Exception as e:
-            logger.error(
-                f"Ошибка при проверке существования группы {chat_id}: {e}",
-                exc_info=True,
-            )
-            raise
+
+        async def load() -> bool:
+            try:
+                stmt = select(func.count(GroupAdmin.chat_id)).where(
+                    GroupAdmin.chat_id == chat_id
+                )
+                result = await session.execute(stmt)
+                count = result.scalar_one()
+                exists = count > 0
+                logger.debug(
+                    "Проверка существования группы %s: %s",
+                    chat_id,
+                    "существует" if exists else "не существует",
+                )
+                return exists
+            except Exception as e:
+                logger.error(
+                    f"Ошибка при проверке существования группы {chat_id}: {e}",
+                    exc_info=True,
+                )
+                raise
+
+        return await group_admin_cache.get_or_load(f"exists:{chat_id}", load)
 
     @staticmethod
     async def is_user_admin(session: AsyncSession, user_id: int) -> bool:
         """Проверяет, является ли пользователь администратором любой группы."""
         try:
-            group_admins = await GroupAdminRepository.get_group_admins_by_user_id(
+            admin_chat_id = await GroupAdminRepository.get_admin_chat_id(
                 session, user_id
             )
-            is_admin = len(group_admins) > 0
-            logger.info(
-                f"Проверка администратора user_id={user_id}: {'является админом' if is_admin else 'не является админом'}"
+            is_admin = admin_chat_id is not None
+            logger.debug(
+                "Проверка администратора user_id=%s: %s",
+                user_id,
+                "является админом" if is_admin else "не является админом",
             )
             return is_admin
         except Exception as e:
@@ -162,21 +205,30 @@ class GroupAdminRepository:
     @staticmethod
     async def get_admin_chat_id(session: AsyncSession, user_id: int) -> int | None:
         """Возвращает chat_id группы, где пользователь является администратором."""
-        try:
-            logger.info(f"Получение admin chat_id для user_id={user_id}")
-            result = await session.execute(
-                select(GroupAdmin.chat_id).where(GroupAdmin.user_id == user_id).limit(1)
-            )
-            chat_id = result.scalar()
-            if chat_id:
-                logger.info(
-                    f"Найден администратор user_id={user_id} для chat_id={chat_id}"
+
+        async def load() -> int | None:
+            try:
+                logger.debug("Получение admin chat_id для user_id=%s", user_id)
+                result = await session.execute(
+                    select(GroupAdmin.chat_id)
+                    .where(GroupAdmin.user_id == user_id)
+                    .limit(1)
                 )
-            else:
-                logger.warning(f"Для user_id={user_id} не найден admin chat_id")
-            return chat_id
-        except Exception as e:
-            logger.error(
-                f"Error getting admin chat_id for user {user_id}: {e}", exc_info=True
-            )
-            raise
+                chat_id = result.scalar()
+                if chat_id:
+                    logger.debug(
+                        "Найден администратор user_id=%s для chat_id=%s",
+                        user_id,
+                        chat_id,
+                    )
+                else:
+                    logger.debug("Для user_id=%s не найден admin chat_id", user_id)
+                return chat_id
+            except Exception as e:
+                logger.error(
+                    f"Error getting admin chat_id for user {user_id}: {e}",
+                    exc_info=True,
+                )
+                raise
+
+        return await group_admin_cache.get_or_load(f"admin_chat:{user_id}", load)
@@ -0,0 +1,109 @@
+import uuid
+from datetime import datetime
+from typing import List, Optional, Sequence
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, func
+from db.models import ScheduledJob
+from bot.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+JOB_PENDING = "pending"
+JOB_ENQUEUED = "enqueued"
+JOB_CANCELLED = "cancelled"
+
+
+class ScheduledJobRepository:
+    @staticmethod
+    def add_job(
+        session: AsyncSession,
+        task_name: str,
+        args: Sequence,
+        due_at: datetime,
+        event_id: Optional[int] = None,
+    ) -> ScheduledJob:
+        """
+        Добавляет задачу в сессию (без коммита). id задачи Celery генерируется
+        сразу, чтобы его можно было сохранить до постановки в очередь.
+        """
+        job = ScheduledJob(
+            task_name=task_name,
+            args=list(args),
+            due_at=due_at,
+            status=JOB_PENDING,
+            task_id=str(uuid.uuid4()),
+            event_id=event_id,
+        )
+        session.add(job)
+        logger.info(f"Запланирована задача {task_name}{tuple(args)} на {due_at}")
+        return job
+
+    @staticmethod
+    async def claim_due_jobs(
+        session: AsyncSession, limit: int = 100
+    ) -> List[ScheduledJob]:
+        """
+        Блокирует наступившие задачи до конца транзакции. Строки, уже взятые
+        другим обработчиком, пропускаются (FOR UPDATE SKIP LOCKED).
+        """
+        try:
+            stmt = (
+                select(ScheduledJob)
+                .where(
+                    ScheduledJob.status == JOB_PENDING,
+                    ScheduledJob.due_at <= func.now(),
+                )
+                .order_by(ScheduledJob.due_at)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            result = await session.execute(stmt)
+            return list(result.scalars().all())
+        except Exception as e:
+            logger.error(f"Ошибка выборки наступивших задач: {e}", exc_info=True)
+            await session.rollback()
+            raise
+
+    @staticmethod
+    async def mark_enqueued(session: AsyncSession, job_ids: Sequence[int]) -> None:
+        """Отмечает задачи отправленными в очередь и фиксирует транзакцию."""
+        try:
+            if job_ids:
+                await session.execute(
+                    update(ScheduledJob)
+                    .where(ScheduledJob.id.in_(job_ids))
+                    .values(status=JOB_ENQUEUED, enqueued_at=func.now())
+                )
+            await session.commit()
+        except Exception as e:
+            logger.error(f"Ошибка обновления статуса задач: {e}", exc_info=True)
+            await session.rollback()
+            raise
+
+    @staticmethod
+    async def get_job_due_at(session: AsyncSession, task_id: str) -> Optional[datetime]:
+        """Время, на которое была запланирована задача с указанным task_id."""
+        result = await session.execute(
+            select(ScheduledJob.due_at).where(ScheduledJob.task_id == task_id)
+        )
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def cancel_event_jobs(
+        session: AsyncSession, event_id: int
+    ) -> List[ScheduledJob]:
+        """Отменяет ещё не отправленные задачи события (без коммита)."""
+        stmt = (
+            update(ScheduledJob)
+            .where(
+                ScheduledJob.event_id == event_id,
+                ScheduledJob.status == JOB_PENDING,
+            )
+            .values(status=JOB_CANCELLED)
+            .returning(ScheduledJob)
+        )
+        result = await session.execute(stmt)
+        jobs = list(result.scalars().all())
+        if jobs:
+            logger.info(f"Отменено задач события {event_id}: {len(jobs)}")
+        return jobs
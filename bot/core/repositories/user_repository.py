@@ -1,10 +1,13 @@
-from typing import Optional, List
+import calendar
+from datetime import date
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, insert
+from sqlalchemy import select, insert, update, extract, and_, or_, func, true
 from sqlalchemy.exc import IntegrityError
-from db.models import User
+from db.models import BeerSelection, Event, User
 from db.schemas import UserCreate
 from bot.logger import setup_logger
+import pendulum
 
 logger = setup_logger(__name__)
 
@@ -25,6 +28,78 @@ class UserRepository:
             )
             raise
 
+    @staticmethod
+    async def get_user_profile(
+        session: AsyncSession, telegram_id: int
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Получает данные профиля одним запросом: пользователя, статистику выборов
+        пива и последний выбор (через LATERAL-подзапросы).
+        """
+        try:
+            stats = (
+                select(
+                    BeerSelection.beer_choice.label("beer"),
+                    func.count().label("count"),
+                )
+                .where(BeerSelection.user_id == User.telegram_id)
+                .group_by(BeerSelection.beer_choice)
+                .lateral("stats")
+            )
+            last_choice = (
+                select(
+                    BeerSelection.beer_choice.label("beer"),
+                    Event.name.label("event_name"),
+                    Event.event_date.label("event_date"),
+                    Event.event_time.label("event_time"),
+                )
+                .join(Event, BeerSelection.event_id == Event.id)
+                .where(BeerSelection.user_id == User.telegram_id)
+                .order_by(BeerSelection.selected_at.desc())
+                .limit(1)
+                .lateral("last_choice")
+            )
+            stmt = (
+                select(
+                    User,
+                    stats.c.beer,
+                    stats.c.count,
+                    last_choice.c.beer,
+                    last_choice.c.event_name,
+                    last_choice.c.event_date,
+                    last_choice.c.event_time,
+                )
+                .select_from(User)
+                .outerjoin(stats, true())
+                .outerjoin(last_choice, true())
+                .where(User.telegram_id == telegram_id)
+            )
+            result = await session.execute(stmt)
+            rows = result.all()
+            if not rows:
+                return None
+
+            beer_stats = {row[1]: row[2] for row in rows if row[1] is not None}
+            last = None
+            user, _, _, beer, event_name, event_date, event_time = rows[0]
+            if beer is not None:
+                event_datetime = pendulum.datetime(
+                    event_date.year,
+                    event_date.month,
+                    event_date.day,
+                    event_time.hour,
+                    event_time.minute,
+                    tz="Europe/Moscow",
+                ).format("DD.MM.YYYY HH:mm")
+                last = (beer, event_name, event_datetime)
+            return {"user": user, "beer_stats": beer_stats, "last_choice": last}
+        except Exception as e:
+            logger.error(
+                f"Ошибка получения профиля пользователя {telegram_id}: {e}",
+                exc_info=True,
+            )
+            raise
+
     @staticmethod
     async def create_user(session: AsyncSession, user_data: UserCreate) -> User:
         """Создает нового пользователя в базе данных."""
@@ -70,3 +145,110 @@ class UserRepository:
         except Exception as e:
             logger.error(f"Ошибка получения всех пользователей: {e}", exc_info=True)
             raise
+
+    @staticmethod
+    async def iter_users(
+        session: AsyncSession,
+        batch_size: int = 500,
+        columns: Optional[Sequence[Any]] = None,
+        where: Sequence[Any] = (),
+    ) -> AsyncIterator[Any]:
+        """
+        Постранично обходит пользователей по telegram_id (keyset-пагинация).
+
+        Если переданы `columns`, возвращаются строки только с этими колонками
+        (telegram_id добавляется автоматически) — это не наполняет identity map
+        сессии, и память не растёт с размером таблицы. Без `columns`
+        возвращаются ORM-объекты `User`.
+        """
+        if columns is not None and User.telegram_id not in columns:
+            columns = [User.telegram_id, *columns]
+        last_id = None
+        try:
+            while True:
+                stmt = (
+                    select(*columns) if columns is not None else select(User)
+                ).where(*where)
+                if last_id is not None:
+                    stmt = stmt.where(User.telegram_id > last_id)
+                stmt = stmt.order_by(User.telegram_id).limit(batch_size)
+                result = await session.execute(stmt)
+                batch = result.all() if columns is not None else result.scalars().all()
+                if not batch:
+                    return
+                for item in batch:
+                    yield item
+                if len(batch) < batch_size:
+                    return
+                last_id = batch[-1].telegram_id
+        except Exception as e:
+            logger.error(
+                f"Ошибка постраничного обхода пользователей: {e}", exc_info=True
+            )
+            raise
+
+    @staticmethod
+    async def get_birthday_users(session: AsyncSession, today: date) -> List[User]:
+        """
+        Возвращает пользователей, у которых сегодня день рождения.
+
+        В невисокосный год родившиеся 29 февраля поздравляются 28 февраля.
+        """
+        try:
+            month = extract("month", User.birth_date)
+            day = extract("day", User.birth_date)
+            condition = and_(month == today.month, day == today.day)
+            if (today.month, today.day) == (2, 28) and not calendar.isleap(today.year):
+                condition = or_(condition, and_(month == 2, day == 29))
+            stmt = select(User).where(condition).order_by(User.telegram_id)
+            result = await session.execute(stmt)
+            users = result.scalars().all()
+            logger.info(f"Найдено {len(users)} именинников на {today}")
+            return list(users)
+        except Exception as e:
+            logger.error(f"Ошибка получения именинников на {today}: {e}", exc_info=True)
+            raise
+
+    @staticmethod
+    async def mark_unreachable(session: AsyncSession, telegram_ids: Sequence[int]):
+        """Помечает пользователей, до которых Telegram больше не доставляет сообщения."""
+        if not telegram_ids:
+            return
+        try:
+            stmt = (
+                update(User)
+                .where(User.telegram_id.in_(telegram_ids), User.is_reachable.is_(True))
+                .values(is_reachable=False)
+            )
+            await session.execute(stmt)
+            await session.commit()
+            logger.info(f"Помечено недоступными пользователей: {len(telegram_ids)}")
+        except Exception as e:
+            logger.error(
+                f"Ошибка пометки недоступных пользователей: {e}", exc_info=True
+            )
+            await session.rollback()
+            raise
+
+    @staticmethod
+    async def mark_reachable(session: AsyncSession, telegram_id: int) -> bool:
+        """Возвращает пользователя в рассылки; True, если флаг был сброшен."""
+        try:
+            stmt = (
+                update(User)
+                .where(User.telegram_id == telegram_id, User.is_reachable.is_(False))
+                .values(is_reachable=True)
+            )
+            result = await session.execute(stmt)
+            await session.commit()
+            restored = result.rowcount is not None and result.rowcount > 0
+            if restored:
+                logger.info("Пользователь %s снова доступен для рассылок", telegram_id)
+            return restored
+        except Exception as e:
+            logger.error(
+                f"Ошибка восстановления доступности пользователя {telegram_id}: {e}",
+                exc_info=True,
+            )
+            await session.rollback()
+            raise
@@ -12,4 +12,10 @@ class EventCreationStates(StatesGroup):
     waiting_for_beer_choice = State()
     waiting_for_beer_options = State()
     waiting_for_notification_choice = State()
-    waiting_for_notification_time = State()
\ No newline at end of file
+    waiting_for_notification_time = State()
+
+
+class EventRescheduleStates(StatesGroup):
+    waiting_for_event = State()
+    waiting_for_date = State()
+    waiting_for_time = State()
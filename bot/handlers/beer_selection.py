@@ -1,12 +1,15 @@
+from dataclasses import dataclass
 from math import radians, sin, cos, sqrt, atan2
 
 from aiogram import Router, types, Bot
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
-from aiogram.utils.keyboard import InlineKeyboardBuilder
 from sqlalchemy.ext.asyncio import AsyncSession
-from bot.core.repositories.event_repository import EventRepository
+from bot.core.repositories.event_repository import (
+    EventRepository,
+    upcoming_events_snapshot,
+)
 from bot.core.repositories.beer_repository import BeerRepository
 from bot.core.repositories.user_repository import UserRepository
 from bot.fsm.beer import BeerSelectionStates
@@ -24,55 +27,97 @@ from bot.texts import (
     BEER_ERROR,
     BEER_TOO_FAR,
 )
-from shared.decorators import private_chat_only
+from shared.filters import PrivateChatOnly
+from bot.keyboards import get_beer_choice_keyboard, get_event_list_keyboard
 from bot.logger import setup_logger
+from bot.utils import SingleFlight
 from db.database import get_async_session_context
-from datetime import datetime
+from datetime import date, datetime, time, timedelta
 import pendulum
 from typing import Optional
 
 logger = setup_logger(__name__)
 router = Router()
 
-
-def get_event_list_keyboard(events):
-    builder = InlineKeyboardBuilder()
-    for event in events:
-        event_time = event.event_time.strftime("%H:%M")
-        button_text = (
-            f"{event.name} @ {event.event_date.strftime('%d.%m.%Y')} {event_time}"
-        )
-        builder.add(
-            types.InlineKeyboardButton(
-                text=button_text, callback_data=f"select_event_{event.id}"
-            )
+# После анонса многие открывают одно и то же событие одновременно
+event_reads = SingleFlight("event_by_id")
+
+
+@dataclass(frozen=True)
+class EventInfo:
+    """Поля события, нужные выбору пива; не привязаны к сессии БД."""
+
+    id: int
+    name: str
+    chat_id: int
+    event_date: date
+    event_time: time
+    starts_at: datetime
+    location_name: Optional[str]
+    description: Optional[str]
+    latitude: Optional[float]
+    longitude: Optional[float]
+    has_beer_choice: bool
+    beer_option_1: Optional[str]
+    beer_option_2: Optional[str]
+
+
+async def load_event(event_id: int) -> Optional[EventInfo]:
+    # Отдельная короткая сессия: результат делят несколько запросов, и отмена
+    # любого из них не должна закрыть сессию, на которой идёт чтение
+    async with get_async_session_context() as session:
+        event = await EventRepository.get_event_by_id(session, event_id)
+        if event is None:
+            return None
+        return EventInfo(
+            id=event.id,
+            name=event.name,
+            chat_id=event.chat_id,
+            event_date=event.event_date,
+            event_time=event.event_time,
+            starts_at=event.starts_at,
+            location_name=event.location_name,
+            description=event.description,
+            latitude=event.latitude,
+            longitude=event.longitude,
+            has_beer_choice=event.has_beer_choice,
+            beer_option_1=event.beer_option_1,
+            beer_option_2=event.beer_option_2,
         )
-    builder.adjust(1)
-    return builder.as_markup()
 
 
-def get_beer_choice_keyboard(event):
-    builder = InlineKeyboardBuilder()
-    if event.has_beer_choice:
-        builder.add(
-            types.InlineKeyboardButton(
-                text=event.beer_option_1, callback_data=f"beer_{event.beer_option_1}"
-            )
-        )
-        builder.add(
-            types.InlineKeyboardButton(
-                text=event.beer_option_2, callback_data=f"beer_{event.beer_option_2}"
-            )
-        )
-        builder.adjust(2)
-    else:
-        builder.add(
-            types.InlineKeyboardButton(text="Лагер", callback_data="beer_Лагер")
-        )
-    return builder.as_markup()
+async def read_event(event_id: int) -> Optional[EventInfo]:
+    """Читает событие, объединяя одновременные запросы одного и того же id."""
+    return await event_reads.do(event_id, lambda: load_event(event_id))
+
+
+@dataclass(frozen=True)
+class UpcomingEvents:
+    """Снимок списка событий для /beer вместе с готовой клавиатурой."""
+
+    starts_at: tuple
+    keyboard: Optional[types.InlineKeyboardMarkup]
+
+
+async def load_upcoming_events() -> UpcomingEvents:
+    async with get_async_session_context() as session:
+        events = await EventRepository.get_startable_events(session, limit=100)
+    return UpcomingEvents(
+        starts_at=tuple(event.starts_at for event in events),
+        keyboard=get_event_list_keyboard(events) if events else None,
+    )
+
+
+def upcoming_events_started(snapshot: UpcomingEvents) -> bool:
+    """Снимок устарел, если ближайшее событие уже началось."""
+    return bool(snapshot.starts_at) and snapshot.starts_at[0] <= pendulum.now(
+        "Europe/Moscow"
+    )
 
 
 EARTH_RADIUS_M = 6371000  # Радиус Земли в метрах
+# Выбор пива открывается за 30 минут до начала события
+BEER_SELECTION_WINDOW = timedelta(minutes=30)
 
 
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
@@ -113,27 +158,12 @@ async def start_beer_selection(
             )
             return
 
-        # Получаем актуальные события
-        # Можно использовать get_upcoming_events_by_date(date=today) для конкретной даты
-        events = await EventRepository.get_upcoming_events(session, limit=100)
-
-        # Фильтруем события, которые ещё не начались
-        now = pendulum.now("Europe/Moscow")
-        upcoming_events = [
-            event
-            for event in events
-            if pendulum.datetime(
-                event.event_date.year,
-                event.event_date.month,
-                event.event_date.day,
-                event.event_time.hour,
-                event.event_time.minute,
-                tz="Europe/Moscow",
-            )
-            > now
-        ]
+        # События, которые ещё не начались, берутся из снимка в памяти
+        upcoming_events = await upcoming_events_snapshot.get(
+            load_upcoming_events, is_stale=upcoming_events_started
+        )
 
-        if not upcoming_events:
+        if upcoming_events.keyboard is None:
             await bot.send_message(
                 chat_id=chat_id,
                 text=BEER_NO_EVENTS,
@@ -143,7 +173,7 @@ async def start_beer_selection(
         await bot.send_message(
             chat_id=chat_id,
             text=BEER_EVENT_LIST,
-            reply_markup=get_event_list_keyboard(upcoming_events),
+            reply_markup=upcoming_events.keyboard,
         )
         await state.set_state(BeerSelectionStates.selecting_event)
     except Exception as e:
@@ -155,8 +185,7 @@ async def start_beer_selection(
         await state.clear()
 
 
-@router.message(Command("beer"))
-@private_chat_only(response_probability=0.5)
+@router.message(Command("beer"), PrivateChatOnly())
 async def beer_command_handler(
     message: types.Message, bot: Bot, state: FSMContext, session: AsyncSession
 ):
@@ -170,8 +199,7 @@ async def beer_command_handler(
     )
 
 
-@router.callback_query(lambda c: c.data == "cmd_beer")
-@private_chat_only(response_probability=0.5)
+@router.callback_query(lambda c: c.data == "cmd_beer", PrivateChatOnly())
 async def beer_callback_handler(
     callback_query: types.CallbackQuery,
     bot: Bot,
@@ -197,8 +225,7 @@ async def beer_callback_handler(
         await state.clear()
 
 
-@router.callback_query(lambda c: c.data.startswith("select_event_"))
-@private_chat_only(response_probability=0.5)
+@router.callback_query(lambda c: c.data.startswith("select_event_"), PrivateChatOnly())
 async def select_event_handler(
     callback_query: types.CallbackQuery,
     bot: Bot,
@@ -211,7 +238,7 @@ async def select_event_handler(
         user_id = callback_query.from_user.id
 
         # Получаем событие
-        event = await EventRepository.get_event_by_id(session, event_id)
+        event = await read_event(event_id)
         if not event:
             await bot.send_message(
                 chat_id=callback_query.message.chat.id,
@@ -234,16 +261,7 @@ async def select_event_handler(
 
         # Проверяем, что до старта события не более 30 минут
         now = pendulum.now("Europe/Moscow")
-        event_start = pendulum.datetime(
-            event.event_date.year,
-            event.event_date.month,
-            event.event_date.day,
-            event.event_time.hour,
-            event.event_time.minute,
-            tz="Europe/Moscow",
-        )
-        time_diff = event_start - now
-        if time_diff.total_minutes() > 30 or event_start <= now:
+        if event.starts_at <= now or event.starts_at - now > BEER_SELECTION_WINDOW:
             await bot.send_message(
                 chat_id=callback_query.message.chat.id,
                 text=BEER_EVENT_TOO_LATE,
@@ -297,11 +315,8 @@ async def select_event_handler(
         await state.clear()
 
 
-@router.message(BeerSelectionStates.confirming_location)
-@private_chat_only(response_probability=0.5)
-async def confirm_location_handler(
-    message: types.Message, bot: Bot, state: FSMContext, session: AsyncSession
-):
+@router.message(BeerSelectionStates.confirming_location, PrivateChatOnly())
+async def confirm_location_handler(message: types.Message, bot: Bot, state: FSMContext):
     try:
         if not message.location:
             await bot.send_message(
@@ -312,7 +327,7 @@ async def confirm_location_handler(
 
         data = await state.get_data()
         event_id = data["event_id"]
-        event = await EventRepository.get_event_by_id(session, event_id)
+        event = await read_event(event_id)
         if not event:
             await bot.send_message(
                 chat_id=message.chat.id,
@@ -328,7 +343,7 @@ async def confirm_location_handler(
             event.latitude,
             event.longitude,
         )
-        logger.debug(f"Distance between user and event: {distance:.2f} meters")
+        logger.debug("Distance between user and event: %.2f meters", distance)
         if distance > 300:
             await bot.send_message(
                 chat_id=message.chat.id,
@@ -352,8 +367,7 @@ async def confirm_location_handler(
         await state.clear()
 
 
-@router.callback_query(lambda c: c.data.startswith("beer_"))
-@private_chat_only(response_probability=0.5)
+@router.callback_query(lambda c: c.data.startswith("beer_"), PrivateChatOnly())
 async def select_beer_handler(
     callback_query: types.CallbackQuery,
     bot: Bot,
@@ -365,6 +379,9 @@ async def select_beer_handler(
         beer_choice = callback_query.data.split("_")[-1]
         user_id = callback_query.from_user.id
         data = await state.get_data()
+        if "event_id" not in data:
+            # Кнопка нажата повторно, когда выбор уже обработан
+            return
         event_id = data["event_id"]
         chat_id = data["chat_id"]
 
@@ -375,10 +392,24 @@ async def select_beer_handler(
             chat_id=chat_id,
             beer_choice=beer_choice,
         )
-        async with get_async_session_context() as session:
-            selection = await BeerRepository.create_beer_selection(
-                session, selection_data
+        selection = await BeerRepository.create_beer_selection(session, selection_data)
+        if selection is None:
+            # Повторное нажатие или гонка: выбор уже сохранён
+            existing_selection = await BeerRepository.get_user_selection(
+                session, user_id, event_id
+            )
+            await bot.send_message(
+                chat_id=callback_query.message.chat.id,
+                text=BEER_ALREADY_SELECTED.format(
+                    beer=(
+                        existing_selection.beer_choice
+                        if existing_selection
+                        else beer_choice
+                    )
+                ),
             )
+            await state.clear()
+            return
 
         await bot.send_message(
             chat_id=callback_query.message.chat.id,
@@ -2,12 +2,14 @@ from aiogram import Router, types, Bot
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
-from aiogram.utils.keyboard import InlineKeyboardBuilder
 from sqlalchemy.ext.asyncio import AsyncSession
-from bot.core.repositories.event_repository import EventRepository
+from bot.core.repositories.event_repository import (
+    BARTENDER_NOTIFICATION_TASK,
+    USER_NOTIFICATION_TASK,
+    EventRepository,
+)
 from bot.core.repositories.group_admin_repository import GroupAdminRepository
-from bot.core.repositories.user_repository import UserRepository
-from bot.fsm.event import EventCreationStates
+from bot.fsm.event import EventCreationStates, EventRescheduleStates
 from db.database import get_async_session_context
 from db.schemas import EventCreate
 from bot.texts import (
@@ -35,7 +37,6 @@ from bot.texts import (
     EVENT_CREATED,
     EVENT_ERROR,
     EVENT_CANCEL_SUCCESS,
-    EVENT_NOTIFICATION_TEXT,
     EVENT_NOTIFICATION_CHOICE_PROMPT,
     EVENT_NOTIFICATION_TIME_PROMPT,
     EVENT_NOTIFICATION_TIME_INVALID,
@@ -44,10 +45,30 @@ from bot.texts import (
     EVENT_NOTIFICATION_TIME_PROMPT_SCHEDULED,
     EVENT_NOTIFICATION_TIME_INVALID_SCHEDULED,
     EVENT_NOTIFICATION_TIME_PAST_SCHEDULED,
+    EVENT_RESCHEDULE_NO_EVENTS,
+    EVENT_RESCHEDULE_SELECT,
+    EVENT_RESCHEDULE_DATE_PROMPT,
+    EVENT_RESCHEDULE_TIME_PROMPT,
+    EVENT_RESCHEDULE_CANCELLED,
+    EVENT_DELETE_NO_EVENTS,
+    EVENT_DELETE_SELECT,
+    EVENT_DELETE_CONFIRM,
+    EVENT_DELETE_SUCCESS,
+    EVENT_DELETE_CANCELLED,
+    EVENT_RESCHEDULE_PAST,
+    EVENT_RESCHEDULED,
+)
+from shared.filters import PrivateChatOnly
+from bot.keyboards import (
+    get_beer_choice_question_keyboard,
+    get_cancel_keyboard,
+    get_delete_confirm_keyboard,
+    get_event_list_keyboard,
+    get_notification_choice_keyboard,
+    get_reschedule_cancel_keyboard,
 )
-from shared.decorators import private_chat_only
 from bot.logger import setup_logger
-from bot.tasks.celery_app import app as celery_app
+from bot.core.repositories.scheduled_job_repository import ScheduledJobRepository
 from sqlalchemy import update
 from db.models import Event
 import pendulum
@@ -55,57 +76,13 @@ import re
 from datetime import time, datetime
 from typing import Optional, Union
 from sqlalchemy.exc import IntegrityError, ProgrammingError
-from aiogram.exceptions import TelegramAPIError
 
 logger = setup_logger(__name__)
 router = Router()
 
 
-def get_cancel_keyboard():
-    builder = InlineKeyboardBuilder()
-    builder.add(
-        types.InlineKeyboardButton(
-            text="❌ Отменить", callback_data="cancel_event_creation"
-        )
-    )
-    return builder.as_markup()
-
-
-def get_beer_choice_keyboard():
-    builder = InlineKeyboardBuilder()
-    builder.add(types.InlineKeyboardButton(text="✅ Да", callback_data="choice_yes"))
-    builder.add(types.InlineKeyboardButton(text="❌ Нет", callback_data="choice_no"))
-    builder.add(
-        types.InlineKeyboardButton(
-            text="🚫 Отменить", callback_data="cancel_event_creation"
-        )
-    )
-    builder.adjust(2, 1)
-    return builder.as_markup()
-
-
-def get_command_keyboard():
-    builder = InlineKeyboardBuilder()
-    builder.add(
-        types.InlineKeyboardButton(text="🍺 Выбрать пиво", callback_data="cmd_beer")
-    )
-    builder.add(types.InlineKeyboardButton(text="👤 Профиль", callback_data="profile"))
-    builder.adjust(2)
-    return builder.as_markup()
-
-
-def get_notification_choice_keyboard():
-    builder = InlineKeyboardBuilder()
-    builder.button(text="Уведомить сейчас", callback_data="notify_now")
-    builder.button(text="Отложенный пост", callback_data="notify_later")
-    builder.button(text="Отмена", callback_data="cancel_event_creation")
-    builder.adjust(2)
-    return builder.as_markup()
-
-
-@router.message(Command("create_event"))
-@router.callback_query(lambda c: c.data == "cmd_create_event")
-@private_chat_only(response_probability=0.5)
+@router.message(Command("create_event"), PrivateChatOnly())
+@router.callback_query(lambda c: c.data == "cmd_create_event", PrivateChatOnly())
 async def create_event_handler(
     update: Union[types.Message, types.CallbackQuery],
     bot: Bot,
@@ -121,7 +98,7 @@ async def create_event_handler(
             user_id = update.from_user.id
             chat_id = update.message.chat.id
             logger.info(
-                f"create_event_handler: user_id={user_id}, from_user={update.from_user}, bot_id={(await bot.get_me()).id}"
+                f"create_event_handler: user_id={user_id}, from_user={update.from_user}, bot_id={bot.id}"
             )
 
         admin_chat_id = await GroupAdminRepository.get_admin_chat_id(session, user_id)
@@ -148,8 +125,7 @@ async def create_event_handler(
         await state.clear()
 
 
-@router.message(EventCreationStates.waiting_for_name)
-@private_chat_only(response_probability=0.5)
+@router.message(EventCreationStates.waiting_for_name, PrivateChatOnly())
 async def process_event_name(message: types.Message, bot: Bot, state: FSMContext):
     try:
         name = message.text.strip()
@@ -177,8 +153,7 @@ async def process_event_name(message: types.Message, bot: Bot, state: FSMContext
         await state.clear()
 
 
-@router.message(EventCreationStates.waiting_for_date)
-@private_chat_only(response_probability=0.5)
+@router.message(EventCreationStates.waiting_for_date, PrivateChatOnly())
 async def process_event_date(message: types.Message, bot: Bot, state: FSMContext):
     try:
         date_str = message.text.strip()
@@ -223,8 +198,7 @@ async def process_event_date(message: types.Message, bot: Bot, state: FSMContext
         await state.clear()
 
 
-@router.message(EventCreationStates.waiting_for_time)
-@private_chat_only(response_probability=0.5)
+@router.message(EventCreationStates.waiting_for_time, PrivateChatOnly())
 async def process_event_time(message: types.Message, bot: Bot, state: FSMContext):
     try:
         time_str = message.text.strip()
@@ -267,8 +241,7 @@ async def process_event_time(message: types.Message, bot: Bot, state: FSMContext
         await state.clear()
 
 
-@router.message(EventCreationStates.waiting_for_location)
-@private_chat_only(response_probability=0.5)
+@router.message(EventCreationStates.waiting_for_location, PrivateChatOnly())
 async def process_event_location(message: types.Message, bot: Bot, state: FSMContext):
     try:
         input_str = message.text.strip()
@@ -324,8 +297,7 @@ async def process_event_location(message: types.Message, bot: Bot, state: FSMCon
         await state.clear()
 
 
-@router.message(EventCreationStates.waiting_for_location_name)
-@private_chat_only(response_probability=0.5)
+@router.message(EventCreationStates.waiting_for_location_name, PrivateChatOnly())
 async def process_event_location_name(
     message: types.Message, bot: Bot, state: FSMContext
 ):
@@ -360,8 +332,7 @@ async def process_event_location_name(
         await state.clear()
 
 
-@router.message(EventCreationStates.waiting_for_description)
-@private_chat_only(response_probability=0.5)
+@router.message(EventCreationStates.waiting_for_description, PrivateChatOnly())
 async def process_event_description(
     message: types.Message, bot: Bot, state: FSMContext
 ):
@@ -394,8 +365,7 @@ async def process_event_description(
         await state.clear()
 
 
-@router.message(EventCreationStates.waiting_for_image)
-@private_chat_only(response_probability=0.5)
+@router.message(EventCreationStates.waiting_for_image, PrivateChatOnly())
 async def process_event_image(message: types.Message, bot: Bot, state: FSMContext):
     try:
         image_file_id = None
@@ -416,7 +386,7 @@ async def process_event_image(message: types.Message, bot: Bot, state: FSMContex
             text=EVENT_BEER_CHOICE_PROMPT.format(
                 image="Есть" if image_file_id else "Нет"
             ),
-            reply_markup=get_beer_choice_keyboard(),
+            reply_markup=get_beer_choice_question_keyboard(),
         )
         await state.set_state(EventCreationStates.waiting_for_beer_choice)
     except Exception as e:
@@ -429,8 +399,9 @@ async def process_event_image(message: types.Message, bot: Bot, state: FSMContex
         await state.clear()
 
 
-@router.callback_query(lambda c: c.data in ["choice_yes", "choice_no"])
-@private_chat_only(response_probability=0.5)
+@router.callback_query(
+    lambda c: c.data in ["choice_yes", "choice_no"], PrivateChatOnly()
+)
 async def process_beer_choice(
     callback_query: types.CallbackQuery, bot: Bot, state: FSMContext
 ):
@@ -466,8 +437,7 @@ async def process_beer_choice(
         await state.clear()
 
 
-@router.message(EventCreationStates.waiting_for_beer_options)
-@private_chat_only(response_probability=0.5)
+@router.message(EventCreationStates.waiting_for_beer_options, PrivateChatOnly())
 async def process_beer_options(message: types.Message, bot: Bot, state: FSMContext):
     try:
         input_str = message.text.strip()
@@ -507,8 +477,9 @@ async def process_beer_options(message: types.Message, bot: Bot, state: FSMConte
         await state.clear()
 
 
-@router.callback_query(lambda c: c.data in ["notify_now", "notify_later"])
-@private_chat_only(response_probability=0.5)
+@router.callback_query(
+    lambda c: c.data in ["notify_now", "notify_later"], PrivateChatOnly()
+)
 async def process_notification_choice(
     callback_query: types.CallbackQuery, bot: Bot, state: FSMContext
 ):
@@ -539,8 +510,7 @@ async def process_notification_choice(
         await state.clear()
 
 
-@router.message(EventCreationStates.waiting_for_notification_time)
-@private_chat_only(response_probability=0.5)
+@router.message(EventCreationStates.waiting_for_notification_time, PrivateChatOnly())
 async def process_notification_time(
     message: types.Message, bot: Bot, state: FSMContext
 ):
@@ -590,8 +560,7 @@ async def process_notification_time(
         await state.clear()
 
 
-@router.callback_query(lambda c: c.data == "cancel_event_creation")
-@private_chat_only(response_probability=0.5)
+@router.callback_query(lambda c: c.data == "cancel_event_creation", PrivateChatOnly())
 async def cancel_event_creation(
     callback_query: types.CallbackQuery, bot: Bot, state: FSMContext
 ):
@@ -658,78 +627,54 @@ async def finalize_event_creation(
         async with get_async_session_context() as session:
             try:
                 event = await EventRepository.create_event(session, event_data)
-                event_start = pendulum.datetime(
-                    year=event.event_date.year,
-                    month=event.event_date.month,
-                    day=event.event_date.day,
-                    hour=event.event_time.hour,
-                    minute=event.event_time.minute,
-                    tz="Europe/Moscow",
-                )
-                user_task_id = None
-                bartender_task_id = None
-                # Планируем задачу для уведомления бармена в event_start
+                # Уведомления хранятся в scheduled_jobs и уходят в Celery в срок
                 try:
-                    bartender_task = celery_app.send_task(
-                        "bot.tasks.bartender_notification.process_bartender_notification",
-                        args=(event.id,),
-                        eta=event_start,
+                    bartender_job = ScheduledJobRepository.add_job(
+                        session,
+                        BARTENDER_NOTIFICATION_TASK,
+                        (event.id, event.version),
+                        due_at=event.starts_at,
+                        event_id=event.id,
+                    )
+                    # Немедленная рассылка тоже идёт через очередь broadcast,
+                    # а не блокирует процесс бота
+                    user_job = ScheduledJobRepository.add_job(
+                        session,
+                        USER_NOTIFICATION_TASK,
+                        (event.id, event.version),
+                        due_at=(
+                            pendulum.now("Europe/Moscow")
+                            if notify_now
+                            else notification_time
+                        ),
+                        event_id=event.id,
+                    )
+                    # Сохраняем ID задач в базе данных
+                    await session.execute(
+                        update(Event)
+                        .where(Event.id == event.id)
+                        .values(
+                            celery_task_id=user_job.task_id,
+                            bartender_task_id=bartender_job.task_id,
+                        )
                     )
-                    bartender_task_id = bartender_task.id
+                    await session.commit()
                     logger.info(
-                        f"Scheduled Celery bartender task {bartender_task_id} for event {event.id} at {event_start}"
+                        f"Scheduled jobs for event {event.id}: bartender at {event.starts_at}, "
+                        f"users at {user_job.due_at}"
                     )
                 except Exception as e:
                     logger.error(
-                        f"Failed to schedule bartender task for event {event.id}: {e}",
+                        f"Failed to schedule notifications for event {event.id}: {e}",
                         exc_info=True,
                     )
+                    await session.rollback()
                     await bot.send_message(
                         chat_id=message.chat.id,
-                        text="⚠️ Событие создано, но уведомление бармену не запланировано.",
+                        text="⚠️ Событие создано, но уведомления не запланированы.",
                     )
                     await state.clear()
                     return
-                # Планируем задачу для уведомления пользователей
-                if notify_now:
-                    await send_event_notifications(bot, event)
-                else:
-                    try:
-                        user_task = celery_app.send_task(
-                            "bot.tasks.bartender_notification.process_user_notification",
-                            args=(event.id,),
-                            eta=notification_time,
-                        )
-                        user_task_id = user_task.id
-                        logger.info(
-                            f"Scheduled Celery user notification task {user_task_id} for event {event.id} at {notification_time}"
-                        )
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to schedule user notification task for event {event.id}: {e}",
-                            exc_info=True,
-                        )
-                        await bot.send_message(
-                            chat_id=message.chat.id,
-                            text="⚠️ Событие создано, но уведомление пользователям не запланировано.",
-                        )
-                        await state.clear()
-                        return
-                # Сохраняем ID задач в базе данных
-                if user_task_id or bartender_task_id:
-                    stmt = (
-                        update(Event)
-                        .where(Event.id == event.id)
-                        .values(
-                            celery_task_id=user_task_id,
-                            bartender_task_id=bartender_task_id,
-                        )
-                    )
-                    await session.execute(stmt)
-                    await session.commit()
-                    logger.info(
-                        f"Saved Celery tasks: user_task_id={user_task_id}, bartender_task_id={bartender_task_id} for event {event.id}"
-                    )
                 summary = EVENT_NOTIFICATION_SUMMARY.format(
                     name=event.name,
                     date=event.event_date.strftime("%d.%m.%Y"),
@@ -780,52 +725,288 @@ async def finalize_event_creation(
             await state.clear()
 
 
-async def send_event_notifications(bot: Bot, event):
+@router.message(Command("reschedule_event"), PrivateChatOnly())
+async def reschedule_event_handler(
+    message: types.Message, bot: Bot, state: FSMContext, session: AsyncSession
+):
     try:
-        async with get_async_session_context() as session:
-            users = await UserRepository.get_all_users(session, limit=1000)
-            notification_text = EVENT_NOTIFICATION_TEXT.format(
+        admin_chat_id = await GroupAdminRepository.get_admin_chat_id(
+            session, message.from_user.id
+        )
+        if not admin_chat_id:
+            await bot.send_message(chat_id=message.chat.id, text=EVENT_NO_PERMISSION)
+            return
+        events = await EventRepository.get_startable_events(
+            session, chat_id=admin_chat_id, limit=20
+        )
+        if not events:
+            await bot.send_message(
+                chat_id=message.chat.id, text=EVENT_RESCHEDULE_NO_EVENTS
+            )
+            return
+        await bot.send_message(
+            chat_id=message.chat.id,
+            text=EVENT_RESCHEDULE_SELECT,
+            reply_markup=get_event_list_keyboard(events, prefix="reschedule_event_"),
+        )
+        await state.set_state(EventRescheduleStates.waiting_for_event)
+    except Exception as e:
+        logger.error(f"Error in reschedule_event handler: {e}", exc_info=True)
+        await bot.send_message(chat_id=message.chat.id, text=EVENT_ERROR)
+        await state.clear()
+
+
+@router.callback_query(
+    EventRescheduleStates.waiting_for_event,
+    lambda c: c.data.startswith("reschedule_event_"),
+    PrivateChatOnly(),
+)
+async def process_reschedule_event_choice(
+    callback_query: types.CallbackQuery,
+    bot: Bot,
+    state: FSMContext,
+    session: AsyncSession,
+):
+    try:
+        await callback_query.answer()
+        event_id = int(callback_query.data.removeprefix("reschedule_event_"))
+        event = await EventRepository.get_event_by_id(session, event_id)
+        admin_chat_id = await GroupAdminRepository.get_admin_chat_id(
+            session, callback_query.from_user.id
+        )
+        if not event or event.chat_id != admin_chat_id:
+            await bot.send_message(
+                chat_id=callback_query.message.chat.id, text=EVENT_NO_PERMISSION
+            )
+            await state.clear()
+            return
+        await state.update_data(reschedule_event_id=event.id, name=event.name)
+        await bot.edit_message_text(
+            chat_id=callback_query.message.chat.id,
+            message_id=callback_query.message.message_id,
+            text=EVENT_RESCHEDULE_DATE_PROMPT.format(name=event.name),
+            reply_markup=get_reschedule_cancel_keyboard(),
+        )
+        await state.set_state(EventRescheduleStates.waiting_for_date)
+    except Exception as e:
+        logger.error(f"Error processing reschedule event choice: {e}", exc_info=True)
+        await bot.send_message(chat_id=callback_query.message.chat.id, text=EVENT_ERROR)
+        await state.clear()
+
+
+@router.message(EventRescheduleStates.waiting_for_date, PrivateChatOnly())
+async def process_reschedule_date(message: types.Message, bot: Bot, state: FSMContext):
+    try:
+        date_str = message.text.strip()
+        if not re.match(r"^\d{2}\.\d{2}\.\d{4}$", date_str):
+            await bot.send_message(
+                chat_id=message.chat.id,
+                text=EVENT_DATE_INVALID,
+                reply_markup=get_reschedule_cancel_keyboard(),
+            )
+            return
+        event_date = pendulum.from_format(
+            date_str, "DD.MM.YYYY", tz="Europe/Moscow"
+        ).date()
+        if event_date < pendulum.now("Europe/Moscow").date():
+            await bot.send_message(
+                chat_id=message.chat.id,
+                text=EVENT_DATE_PAST,
+                reply_markup=get_reschedule_cancel_keyboard(),
+            )
+            return
+        await state.update_data(event_date=event_date.to_date_string())
+        await bot.send_message(
+            chat_id=message.chat.id,
+            text=EVENT_RESCHEDULE_TIME_PROMPT.format(
+                date=event_date.strftime("%d.%m.%Y")
+            ),
+            reply_markup=get_reschedule_cancel_keyboard(),
+        )
+        await state.set_state(EventRescheduleStates.waiting_for_time)
+    except (pendulum.exceptions.ParserError, ValueError):
+        await bot.send_message(
+            chat_id=message.chat.id,
+            text=EVENT_DATE_INVALID,
+            reply_markup=get_reschedule_cancel_keyboard(),
+        )
+    except Exception as e:
+        logger.error(f"Error processing reschedule date: {e}", exc_info=True)
+        await bot.send_message(chat_id=message.chat.id, text=EVENT_ERROR)
+        await state.clear()
+
+
+@router.message(EventRescheduleStates.waiting_for_time, PrivateChatOnly())
+async def process_reschedule_time(
+    message: types.Message, bot: Bot, state: FSMContext, session: AsyncSession
+):
+    try:
+        time_str = message.text.strip()
+        if not re.match(r"^\d{2}:\d{2}$", time_str):
+            await bot.send_message(
+                chat_id=message.chat.id,
+                text=EVENT_TIME_INVALID,
+                reply_markup=get_reschedule_cancel_keyboard(),
+            )
+            return
+        event_time = datetime.strptime(time_str, "%H:%M").time()
+        data = await state.get_data()
+        event_date = pendulum.parse(data["event_date"]).date()
+        starts_at = EventRepository.compute_starts_at(event_date, event_time)
+        if starts_at <= pendulum.now("Europe/Moscow"):
+            await bot.send_message(
+                chat_id=message.chat.id,
+                text=EVENT_RESCHEDULE_PAST,
+                reply_markup=get_reschedule_cancel_keyboard(),
+            )
+            return
+        event = await EventRepository.reschedule_event(
+            session, int(data["reschedule_event_id"]), event_date, event_time
+        )
+        await state.clear()
+        if event is None:
+            await bot.send_message(chat_id=message.chat.id, text=EVENT_ERROR)
+            return
+        await bot.send_message(
+            chat_id=message.chat.id,
+            text=EVENT_RESCHEDULED.format(
+                name=event.name,
+                date=event_date.strftime("%d.%m.%Y"),
+                time=event_time.strftime("%H:%M"),
+            ),
+        )
+        logger.info(f"Event {event.id} rescheduled by {message.from_user.id}")
+    except ValueError:
+        await bot.send_message(
+            chat_id=message.chat.id,
+            text=EVENT_TIME_INVALID,
+            reply_markup=get_reschedule_cancel_keyboard(),
+        )
+    except Exception as e:
+        logger.error(f"Error processing reschedule time: {e}", exc_info=True)
+        await bot.send_message(chat_id=message.chat.id, text=EVENT_ERROR)
+        await state.clear()
+
+
+@router.callback_query(lambda c: c.data == "cancel_event_reschedule", PrivateChatOnly())
+async def cancel_event_reschedule(
+    callback_query: types.CallbackQuery, bot: Bot, state: FSMContext
+):
+    try:
+        await callback_query.answer()
+        await state.clear()
+        await bot.edit_message_text(
+            chat_id=callback_query.message.chat.id,
+            message_id=callback_query.message.message_id,
+            text=EVENT_RESCHEDULE_CANCELLED,
+        )
+    except Exception as e:
+        logger.error(f"Error cancelling event reschedule: {e}", exc_info=True)
+        await state.clear()
+
+
+async def get_admin_event(
+    session: AsyncSession, user_id: int, event_id: int
+) -> Optional[Event]:
+    """Событие, если оно принадлежит группе, где пользователь администратор."""
+    admin_chat_id = await GroupAdminRepository.get_admin_chat_id(session, user_id)
+    event = await EventRepository.get_event_by_id(session, event_id)
+    if not admin_chat_id or not event or event.chat_id != admin_chat_id:
+        return None
+    return event
+
+
+@router.message(Command("delete_event"), PrivateChatOnly())
+async def delete_event_handler(message: types.Message, bot: Bot, session: AsyncSession):
+    try:
+        admin_chat_id = await GroupAdminRepository.get_admin_chat_id(
+            session, message.from_user.id
+        )
+        if not admin_chat_id:
+            await bot.send_message(chat_id=message.chat.id, text=EVENT_NO_PERMISSION)
+            return
+        events = await EventRepository.get_startable_events(
+            session, chat_id=admin_chat_id, limit=20
+        )
+        if not events:
+            await bot.send_message(chat_id=message.chat.id, text=EVENT_DELETE_NO_EVENTS)
+            return
+        await bot.send_message(
+            chat_id=message.chat.id,
+            text=EVENT_DELETE_SELECT,
+            reply_markup=get_event_list_keyboard(events, prefix="delete_event_"),
+        )
+    except Exception as e:
+        logger.error(f"Error in delete_event handler: {e}", exc_info=True)
+        await bot.send_message(chat_id=message.chat.id, text=EVENT_ERROR)
+
+
+@router.callback_query(lambda c: c.data.startswith("delete_event_"), PrivateChatOnly())
+async def process_delete_event_choice(
+    callback_query: types.CallbackQuery, bot: Bot, session: AsyncSession
+):
+    try:
+        await callback_query.answer()
+        event_id = int(callback_query.data.removeprefix("delete_event_"))
+        event = await get_admin_event(session, callback_query.from_user.id, event_id)
+        if not event:
+            await bot.send_message(
+                chat_id=callback_query.message.chat.id, text=EVENT_NO_PERMISSION
+            )
+            return
+        await bot.edit_message_text(
+            chat_id=callback_query.message.chat.id,
+            message_id=callback_query.message.message_id,
+            text=EVENT_DELETE_CONFIRM.format(
                 name=event.name,
                 date=event.event_date.strftime("%d.%m.%Y"),
                 time=event.event_time.strftime("%H:%M"),
-                location=event.location_name or "Не указано",
-                description=event.description or "Не указано",
-                beer_options=(
-                    f"{event.beer_option_1}, {event.beer_option_2}"
-                    if event.has_beer_choice
-                    else "Лагер"
-                ),
-            )
-            successful_sends = 0
-            failed_sends = 0
-            for user in users:
-                try:
-                    if event.image_file_id:
-                        await bot.send_photo(
-                            chat_id=user.telegram_id,
-                            photo=event.image_file_id,
-                            caption=notification_text,
-                            reply_markup=get_command_keyboard(),
-                        )
-                    else:
-                        await bot.send_message(
-                            chat_id=user.telegram_id,
-                            text=notification_text,
-                            reply_markup=get_command_keyboard(),
-                        )
-                    successful_sends += 1
-                except TelegramAPIError as e:
-                    logger.warning(
-                        f"Failed to send notification to user {user.telegram_id}: {e}"
-                    )
-                    failed_sends += 1
-                except Exception as e:
-                    logger.error(
-                        f"Unexpected error sending notification to user {user.telegram_id}: {e}"
-                    )
-                    failed_sends += 1
-            logger.info(
-                f"Event notifications sent: {successful_sends} successful, {failed_sends} failed"
+            ),
+            reply_markup=get_delete_confirm_keyboard(event.id),
+        )
+    except Exception as e:
+        logger.error(f"Error processing delete event choice: {e}", exc_info=True)
+        await bot.send_message(chat_id=callback_query.message.chat.id, text=EVENT_ERROR)
+
+
+@router.callback_query(
+    lambda c: c.data.startswith("confirm_delete_event_"), PrivateChatOnly()
+)
+async def confirm_delete_event(
+    callback_query: types.CallbackQuery, bot: Bot, session: AsyncSession
+):
+    try:
+        await callback_query.answer()
+        event_id = int(callback_query.data.removeprefix("confirm_delete_event_"))
+        event = await get_admin_event(session, callback_query.from_user.id, event_id)
+        if not event:
+            await bot.send_message(
+                chat_id=callback_query.message.chat.id, text=EVENT_NO_PERMISSION
             )
+            return
+        name = event.name
+        # Отложенные задачи удаляются каскадно, уже поставленные в очередь
+        # увидят в Redis, что событие удалено
+        await EventRepository.delete_event(session, event_id)
+        await bot.edit_message_text(
+            chat_id=callback_query.message.chat.id,
+            message_id=callback_query.message.message_id,
+            text=EVENT_DELETE_SUCCESS.format(name=name),
+        )
+        logger.info(f"Event {event_id} deleted by {callback_query.from_user.id}")
+    except Exception as e:
+        logger.error(f"Error deleting event: {e}", exc_info=True)
+        await bot.send_message(chat_id=callback_query.message.chat.id, text=EVENT_ERROR)
+
+
+@router.callback_query(lambda c: c.data == "cancel_event_delete", PrivateChatOnly())
+async def cancel_event_delete(callback_query: types.CallbackQuery, bot: Bot):
+    try:
+        await callback_query.answer()
+        await bot.edit_message_text(
+            chat_id=callback_query.message.chat.id,
+            message_id=callback_query.message.message_id,
+            text=EVENT_DELETE_CANCELLED,
+        )
     except Exception as e:
-        logger.error(f"Error sending event notifications: {e}", exc_info=True)
+        logger.error(f"Error cancelling event delete: {e}", exc_info=True)
@@ -1,9 +1,12 @@
-from aiogram import Router, Bot
+from aiogram import F, Router, Bot
 from aiogram.types import ChatMemberUpdated
 from aiogram.enums.chat_member_status import ChatMemberStatus
+from aiogram.enums.chat_type import ChatType
 from aiogram.exceptions import TelegramForbiddenError
 from sqlalchemy.ext.asyncio import AsyncSession
 from bot.core.repositories.group_admin_repository import GroupAdminRepository
+from bot.core.repositories.user_repository import UserRepository
+from bot.core.cache import chat_member_cache
 from db.schemas import GroupAdminCreate
 from bot.texts import GROUP_ADMIN_REMOVED
 from bot.logger import setup_logger
@@ -12,6 +15,22 @@ router = Router()
 logger = setup_logger("group_join")
 
 
+@router.my_chat_member(F.chat.type == ChatType.PRIVATE)
+async def on_private_chat_member(event: ChatMemberUpdated, session: AsyncSession):
+    """Пользователь заблокировал или разблокировал бота в личке."""
+    user_id = event.chat.id
+    new_status = event.new_chat_member.status
+    try:
+        if new_status == ChatMemberStatus.KICKED:
+            await UserRepository.mark_unreachable(session, [user_id])
+        elif new_status == ChatMemberStatus.MEMBER:
+            await UserRepository.mark_reachable(session, user_id)
+    except Exception as e:
+        logger.error(
+            f"Ошибка обновления доступности пользователя {user_id}: {e}", exc_info=True
+        )
+
+
 @router.my_chat_member()
 async def on_my_chat_member(event: ChatMemberUpdated, bot: Bot, session: AsyncSession):
     logger.info("Получено обновление my_chat_member")
@@ -28,10 +47,14 @@ async def on_my_chat_member(event: ChatMemberUpdated, bot: Bot, session: AsyncSe
         new_status = event.new_chat_member.status
         old_status = event.old_chat_member.status
 
+        # Права бота в чате изменились — прежние статусы участников могли устареть
+        chat_member_cache.invalidate(chat_id)
+        chat_member_cache.set_status(chat_id, bot_user.id, new_status)
+
         # Проверяем, является ли пользователь администратором
         try:
-            member = await bot.get_chat_member(chat_id, admin_id)
-            if member.status not in [
+            status = await chat_member_cache.get_status(bot, chat_id, admin_id)
+            if status not in [
                 ChatMemberStatus.ADMINISTRATOR,
                 ChatMemberStatus.CREATOR,
             ]:
@@ -81,3 +104,11 @@ async def on_my_chat_member(event: ChatMemberUpdated, bot: Bot, session: AsyncSe
             )
     except Exception as e:
         logger.error(f"Ошибка при обработке события my_chat_member: {e}", exc_info=True)
+
+
+@router.chat_member()
+async def on_chat_member(event: ChatMemberUpdated):
+    """Обновляет кэш статусов при изменении участников чата."""
+    chat_member_cache.set_status(
+        event.chat.id, event.new_chat_member.user.id, event.new_chat_member.status
+    )
@@ -1,19 +1,12 @@
 from aiogram import Router, Bot
-from aiogram.types import (
-    Message,
-    InlineKeyboardButton,
-    InlineKeyboardMarkup,
-    CallbackQuery,
-)
+from aiogram.types import Message, CallbackQuery
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
-from aiogram.utils.keyboard import InlineKeyboardBuilder
 from sqlalchemy.ext.asyncio import AsyncSession
 from bot.fsm.registration import Registration
 from db.schemas import UserCreate
 from bot.core.repositories.user_repository import UserRepository
 from bot.core.repositories.group_admin_repository import GroupAdminRepository
-from bot.core.repositories.beer_repository import BeerRepository
 from bot.texts import (
     NAME_TOO_SHORT,
     ASK_BIRTH_DATE,
@@ -24,7 +17,8 @@ from bot.texts import (
     PROFILE_NOT_REGISTERED,
     PROFILE_MESSAGE,
 )
-from shared.decorators import private_chat_only
+from shared.filters import PrivateChatOnly
+from bot.keyboards import get_command_keyboard, get_profile_keyboard
 from bot.logger import setup_logger
 from datetime import datetime
 import pendulum
@@ -33,24 +27,7 @@ router = Router()
 logger = setup_logger("registration")
 
 
-def get_command_keyboard():
-    builder = InlineKeyboardBuilder()
-    builder.add(InlineKeyboardButton(text="🍺 Выбрать пиво", callback_data="cmd_beer"))
-    builder.add(InlineKeyboardButton(text="👤 Профиль", callback_data="cmd_profile"))
-    builder.adjust(2)
-    return builder.as_markup()
-
-
-def get_profile_keyboard():
-    builder = InlineKeyboardBuilder()
-    builder.add(InlineKeyboardButton(text="🍺 Выбрать пиво", callback_data="cmd_beer"))
-    builder.add(InlineKeyboardButton(text="🏠 В начало", callback_data="cmd_start"))
-    builder.adjust(2)
-    return builder.as_markup()
-
-
-@router.message(Registration.name)
-@private_chat_only(response_probability=0.5)
+@router.message(Registration.name, PrivateChatOnly())
 async def get_name(message: Message, state: FSMContext):
     name = message.text.strip()
     if len(name) < 2:
@@ -61,8 +38,7 @@ async def get_name(message: Message, state: FSMContext):
     await message.answer(ASK_BIRTH_DATE)
 
 
-@router.message(Registration.birth_date)
-@private_chat_only(response_probability=0.5)
+@router.message(Registration.birth_date, PrivateChatOnly())
 async def get_birth_date(message: Message, state: FSMContext, session: AsyncSession):
     raw = message.text.strip()
     data = await state.get_data()
@@ -121,12 +97,13 @@ async def show_profile(
     chat_id: int, user_id: int, bot: Bot, state: FSMContext, session: AsyncSession
 ):
     try:
-        user = await UserRepository.get_user_by_id(session, user_id)
-        if not user:
+        profile = await UserRepository.get_user_profile(session, user_id)
+        if not profile:
             await bot.send_message(chat_id=chat_id, text=PROFILE_NOT_REGISTERED)
             await state.clear()
             return
 
+        user = profile["user"]
         birth_date_str = "Не указана"
         age_str = ""
         if user.birth_date and user.birth_date.year != 1900:
@@ -142,7 +119,7 @@ async def show_profile(
             )
             age_str = f"{age} лет\n"
 
-        beer_stats = await BeerRepository.get_beer_stats(session, user_id)
+        beer_stats = profile["beer_stats"]
         beer_stats_str = "Нет выборов\n"
         if beer_stats:
             beer_stats_str = (
@@ -152,7 +129,7 @@ async def show_profile(
                 + "\n"
             )
 
-        last_choice = await BeerRepository.get_last_beer_choice(session, user_id)
+        last_choice = profile["last_choice"]
         last_choice_str = "Нет выборов"
         if last_choice:
             beer_choice, event_name, event_datetime = last_choice
@@ -191,8 +168,7 @@ async def show_profile(
         await state.clear()
 
 
-@router.message(Command("profile"))
-@private_chat_only(response_probability=0.5)
+@router.message(Command("profile"), PrivateChatOnly())
 async def profile_command_handler(
     message: Message, bot: Bot, state: FSMContext, session: AsyncSession
 ):
@@ -205,8 +181,7 @@ async def profile_command_handler(
     )
 
 
-@router.callback_query(lambda c: c.data == "cmd_profile")
-@private_chat_only(response_probability=0.5)
+@router.callback_query(lambda c: c.data == "cmd_profile", PrivateChatOnly())
 async def profile_callback_handler(
     callback_query: CallbackQuery,
     bot: Bot,
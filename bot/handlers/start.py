@@ -1,11 +1,11 @@
 from aiogram import Router, Bot, types
 from aiogram.types import Message, InlineKeyboardButton, InlineKeyboardMarkup
-from aiogram.utils.keyboard import InlineKeyboardBuilder
 from aiogram.filters import CommandStart
 from aiogram.fsm.context import FSMContext
 from sqlalchemy.ext.asyncio import AsyncSession
 from bot.core.repositories.user_repository import UserRepository
 from bot.core.repositories.group_admin_repository import GroupAdminRepository
+from bot.core.cache import chat_member_cache
 from bot.texts import (
     START_SIMPLE_TEXT,
     START_ALREADY_REGISTERED,
@@ -18,33 +18,20 @@ from bot.texts import (
     BOT_NOT_ADMIN,
 )
 from bot.fsm.registration import Registration
-from shared.decorators import private_chat_only
+from shared.filters import PrivateChatOnly
+from bot.keyboards import get_command_keyboard
 from bot.logger import setup_logger
 
 router = Router()
 logger = setup_logger("start")
 
 
-def get_command_keyboard(is_admin: bool = False) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.add(InlineKeyboardButton(text="🍺 Выбрать пиво", callback_data="cmd_beer"))
-    builder.add(InlineKeyboardButton(text="👤 Профиль", callback_data="cmd_profile"))
-    if is_admin:
-        builder.add(
-            InlineKeyboardButton(
-                text="Создать событие", callback_data="cmd_create_event"
-            )
-        )
-    builder.adjust(2)
-    return builder.as_markup()
-
-
 async def is_bot_admin(bot: Bot, chat_id: int) -> bool:
     """Проверяет, является ли бот администратором в группе."""
     try:
-        bot_user = await bot.get_me()
-        chat_member = await bot.get_chat_member(chat_id=chat_id, user_id=bot_user.id)
-        return chat_member.status in ["administrator", "creator"]
+        bot_user = await bot.me()
+        status = await chat_member_cache.get_status(bot, chat_id, bot_user.id)
+        return status in ["administrator", "creator"]
     except Exception as e:
         logger.error(
             f"Error checking bot admin status for chat_id={chat_id}: {e}", exc_info=True
@@ -76,6 +63,9 @@ async def start_command(
                 return
 
         user = await UserRepository.get_user_by_id(session, user_id)
+        # Пользователь снова пишет боту в личку — возвращаем его в рассылки
+        if is_private and user and not user.is_reachable:
+            await UserRepository.mark_reachable(session, user_id)
         is_admin = bool(await GroupAdminRepository.get_admin_chat_id(session, user_id))
 
         # Проверяем, зарегистрирован ли пользователь в указанной группе (для групп)
@@ -121,7 +111,7 @@ async def start_command(
 
         # В группе: показываем диплинк для регистрации
         if not is_private:
-            bot_user = await bot.get_me()
+            bot_user = await bot.me()
             deeplink = f"https://t.me/{bot_user.username}?start=registration_{chat_id}"
             keyboard = InlineKeyboardMarkup(
                 inline_keyboard=[
@@ -187,8 +177,7 @@ async def cmd_start(message: Message, session: AsyncSession, state: FSMContext):
     )
 
 
-@router.callback_query(lambda c: c.data == "cmd_start")
-@private_chat_only(response_probability=0.5)
+@router.callback_query(lambda c: c.data == "cmd_start", PrivateChatOnly())
 async def start_callback_handler(
     callback_query: types.CallbackQuery,
     bot: Bot,
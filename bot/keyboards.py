@@ -0,0 +1,141 @@
+from functools import lru_cache
+from typing import Iterable, Optional
+
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
+from aiogram.utils.keyboard import InlineKeyboardBuilder
+
+# Статические клавиатуры собираются один раз при импорте и переиспользуются
+# всеми обработчиками и рассылками. Разметка aiogram изменяема, а возвращаемые
+# объекты общие: их нельзя изменять — для другой клавиатуры соберите новую.
+
+
+def _build(
+    buttons: Iterable[InlineKeyboardButton], *sizes: int
+) -> InlineKeyboardMarkup:
+    builder = InlineKeyboardBuilder()
+    builder.add(*buttons)
+    if sizes:
+        builder.adjust(*sizes)
+    return builder.as_markup()
+
+
+BEER_BUTTON = InlineKeyboardButton(text="🍺 Выбрать пиво", callback_data="cmd_beer")
+PROFILE_BUTTON = InlineKeyboardButton(text="👤 Профиль", callback_data="cmd_profile")
+
+COMMAND_KEYBOARD = _build([BEER_BUTTON, PROFILE_BUTTON], 2)
+ADMIN_COMMAND_KEYBOARD = _build(
+    [
+        BEER_BUTTON,
+        PROFILE_BUTTON,
+        InlineKeyboardButton(text="Создать событие", callback_data="cmd_create_event"),
+    ],
+    2,
+)
+PROFILE_KEYBOARD = _build(
+    [BEER_BUTTON, InlineKeyboardButton(text="🏠 В начало", callback_data="cmd_start")],
+    2,
+)
+CANCEL_KEYBOARD = _build(
+    [InlineKeyboardButton(text="❌ Отменить", callback_data="cancel_event_creation")]
+)
+RESCHEDULE_CANCEL_KEYBOARD = _build(
+    [InlineKeyboardButton(text="❌ Отменить", callback_data="cancel_event_reschedule")]
+)
+BEER_CHOICE_QUESTION_KEYBOARD = _build(
+    [
+        InlineKeyboardButton(text="✅ Да", callback_data="choice_yes"),
+        InlineKeyboardButton(text="❌ Нет", callback_data="choice_no"),
+        InlineKeyboardButton(text="🚫 Отменить", callback_data="cancel_event_creation"),
+    ],
+    2,
+    1,
+)
+NOTIFICATION_CHOICE_KEYBOARD = _build(
+    [
+        InlineKeyboardButton(text="Уведомить сейчас", callback_data="notify_now"),
+        InlineKeyboardButton(text="Отложенный пост", callback_data="notify_later"),
+        InlineKeyboardButton(text="Отмена", callback_data="cancel_event_creation"),
+    ],
+    2,
+)
+
+
+def get_command_keyboard(is_admin: bool = False) -> InlineKeyboardMarkup:
+    return ADMIN_COMMAND_KEYBOARD if is_admin else COMMAND_KEYBOARD
+
+
+def get_profile_keyboard() -> InlineKeyboardMarkup:
+    return PROFILE_KEYBOARD
+
+
+def get_cancel_keyboard() -> InlineKeyboardMarkup:
+    return CANCEL_KEYBOARD
+
+
+def get_reschedule_cancel_keyboard() -> InlineKeyboardMarkup:
+    return RESCHEDULE_CANCEL_KEYBOARD
+
+
+def get_delete_confirm_keyboard(event_id: int) -> InlineKeyboardMarkup:
+    return _build(
+        [
+            InlineKeyboardButton(
+                text="🗑 Удалить", callback_data=f"confirm_delete_event_{event_id}"
+            ),
+            InlineKeyboardButton(
+                text="❌ Отменить", callback_data="cancel_event_delete"
+            ),
+        ],
+        2,
+    )
+
+
+def get_beer_choice_question_keyboard() -> InlineKeyboardMarkup:
+    return BEER_CHOICE_QUESTION_KEYBOARD
+
+
+def get_notification_choice_keyboard() -> InlineKeyboardMarkup:
+    return NOTIFICATION_CHOICE_KEYBOARD
+
+
+@lru_cache(maxsize=256)
+def _beer_options_keyboard(
+    has_beer_choice: bool, option_1: Optional[str], option_2: Optional[str]
+) -> InlineKeyboardMarkup:
+    if not has_beer_choice:
+        return _build([InlineKeyboardButton(text="Лагер", callback_data="beer_Лагер")])
+    return _build(
+        [
+            InlineKeyboardButton(text=option_1, callback_data=f"beer_{option_1}"),
+            InlineKeyboardButton(text=option_2, callback_data=f"beer_{option_2}"),
+        ],
+        2,
+    )
+
+
+def get_beer_choice_keyboard(event) -> InlineKeyboardMarkup:
+    """
+    Клавиатура выбора пива для события; одна на каждый набор вариантов.
+    Объект общий для всех вызовов — не изменяйте его.
+    """
+    return _beer_options_keyboard(
+        bool(event.has_beer_choice), event.beer_option_1, event.beer_option_2
+    )
+
+
+def get_event_list_keyboard(
+    events, prefix: str = "select_event_"
+) -> InlineKeyboardMarkup:
+    return _build(
+        [
+            InlineKeyboardButton(
+                text=(
+                    f"{event.name} @ {event.event_date.strftime('%d.%m.%Y')} "
+                    f"{event.event_time.strftime('%H:%M')}"
+                ),
+                callback_data=f"{prefix}{event.id}",
+            )
+            for event in events
+        ],
+        1,
+    )
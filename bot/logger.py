@@ -1,7 +1,10 @@
+import atexit
+import copy
 import logging
 import os
+import queue
 import traceback
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 import pendulum
 
@@ -30,6 +33,8 @@ class MoscowFormatter(logging.Formatter):
         return pendulum.from_timestamp(timestamp, tz="Europe/Moscow").timetuple()
 
     def format(self, record):
+        # Запись общая для консоли и файла — дополняем её копию
+        record = copy.copy(record)
         record.asctime = self.formatTime(record, self.datefmt)
         if record.exc_info:
             stack = traceback.extract_tb(record.exc_info[2])
@@ -51,36 +56,103 @@ class MoscowFormatter(logging.Formatter):
         return formatter.format(record)
 
 
-def setup_logger(
-    name: str,
-    log_file: str = os.getenv("LOG_FILE", "bot.log"),
-    log_dir: str = "logs",
-) -> logging.Logger:
-    logger = logging.getLogger(name)
+class _RecordQueueHandler(QueueHandler):
+    """
+    Кладёт записи в очередь без форматирования.
 
-    if logger.handlers:  # avoid re-adding handlers
-        return logger
+    Стандартный `prepare` форматирует запись в вызывающем потоке и отбрасывает
+    exc_info, а `MoscowFormatter` строит по нему трассировку. Здесь в записи
+    только подставляются аргументы сообщения; форматирование и запись на диск
+    выполняет поток `QueueListener`.
+    """
 
-    log_level = os.getenv("LOG_LEVEL", "INFO").upper()
-    logger.setLevel(getattr(logging, log_level, logging.INFO))
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
 
-    os.makedirs(log_dir, exist_ok=True)
+
+# Один слушатель на файл лога: (обработчик очереди, слушатель)
+_pipelines: dict[str, tuple[QueueHandler, QueueListener]] = {}
+
+
+def _get_queue_handler(log_path: str, log_level: int) -> QueueHandler:
+    """Возвращает обработчик очереди для файла, запуская слушателя один раз."""
+    pipeline = _pipelines.get(log_path)
+    if pipeline is not None:
+        return pipeline[0]
 
     file_handler = RotatingFileHandler(
-        os.path.join(log_dir, log_file),
+        log_path,
         maxBytes=500_000,
         backupCount=5,
         encoding="utf-8",
     )
     file_handler.setLevel(logging.ERROR)
     file_handler.setFormatter(MoscowFormatter())
-    logger.addHandler(file_handler)
+    handlers = [file_handler]
 
     if os.getenv("CONSOLE_LOGGING", "true").lower() == "true":
         stream_handler = logging.StreamHandler()
-        stream_handler.setLevel(getattr(logging, log_level, logging.INFO))
+        stream_handler.setLevel(log_level)
         stream_handler.setFormatter(MoscowFormatter())
-        logger.addHandler(stream_handler)
+        handlers.append(stream_handler)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = _RecordQueueHandler(log_queue)
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _pipelines[log_path] = (queue_handler, listener)
+    return queue_handler
+
+
+def _stop_listeners():
+    """Дописывает оставшиеся в очередях записи и останавливает слушателей."""
+    # В _pipelines только запущенные слушатели; остановленные из него убираются
+    for _, listener in _pipelines.values():
+        listener.stop()
+    _pipelines.clear()
+
+
+def _restart_listeners_after_fork():
+    # Поток слушателя не переживает fork (prefork-воркеры Celery):
+    # дочерний процесс получает новые очереди и своих слушателей
+    for log_path, (queue_handler, listener) in _pipelines.items():
+        log_queue = queue.SimpleQueue()
+        queue_handler.queue = log_queue
+        child_listener = QueueListener(
+            log_queue, *listener.handlers, respect_handler_level=True
+        )
+        child_listener.start()
+        _pipelines[log_path] = (queue_handler, child_listener)
+
+
+atexit.register(_stop_listeners)
+os.register_at_fork(after_in_child=_restart_listeners_after_fork)
+
+
+def setup_logger(
+    name: str,
+    log_file: str = os.getenv("LOG_FILE", "bot.log"),
+    log_dir: str = "logs",
+) -> logging.Logger:
+    """
+    Возвращает логгер, пишущий через очередь.
+
+    Вызов `logger.info` только кладёт запись в очередь; форматирование, вывод
+    в консоль и запись в файл выполняет фоновый поток слушателя.
+    """
+    logger = logging.getLogger(name)
+
+    if logger.handlers:  # avoid re-adding handlers
+        return logger
+
+    log_level = getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper(), logging.INFO)
+    logger.setLevel(log_level)
+
+    os.makedirs(log_dir, exist_ok=True)
+    logger.addHandler(_get_queue_handler(os.path.join(log_dir, log_file), log_level))
 
     logger.propagate = False
     return logger
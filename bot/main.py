@@ -8,10 +8,15 @@ from redis.asyncio import Redis
 
 from bot.logger import setup_logger
 from bot.middlewares.db import DBSessionMiddleware
+from bot.middlewares.concurrency import ConcurrencyLimitMiddleware, log_metrics
 from bot.handlers import start, registration, join, event, beer_selection
 from bot.error_handler import setup_error_handler
+from bot.webhook import run_webhook
 from shared.config import settings
-from db.database import init_db
+from db.database import init_db, dispose_engine, get_async_session_context
+from bot.core.repositories.beer_repository import BeerRepository
+from bot.core.cache import listen_invalidations, close_redis
+from bot.utils import single_flight_stats
 
 logger = setup_logger("bot")
 
@@ -25,10 +30,20 @@ async def main():
         loop = asyncio.get_event_loop()
         await init_db(loop=loop)
         logger.info("База данных инициализирована")
+        # Разовое заполнение счётчиков заказов по выборам, сделанным до их
+        # появления; дальше расхождения исправляет ночная сверка
+        try:
+            async with get_async_session_context() as session:
+                if await BeerRepository.counters_need_backfill(session):
+                    await BeerRepository.reconcile_beer_counters(session)
+        except Exception as e:
+            logger.error(f"Не удалось заполнить счётчики заказов: {e}", exc_info=True)
 
         # Настройка Redis для FSM
         redis = Redis.from_url(settings.REDIS_URL)
         storage = RedisStorage(redis=redis)
+        # Сброс локальных кэшей по сигналам других процессов
+        cache_listener = asyncio.create_task(listen_invalidations())
 
         # Создание бота и диспетчера
         bot = Bot(
@@ -36,9 +51,16 @@ async def main():
             default=DefaultBotProperties(parse_mode=ParseMode.HTML),
         )
 
+        # Данные бота запрашиваются один раз и дальше берутся из bot.me()
+        bot_user = await bot.me()
+        logger.info(f"Бот @{bot_user.username} (id={bot_user.id})")
+
         dp = Dispatcher(storage=storage)
 
         # Регистрация middleware
+        # Ограничение параллельной обработки — до выдачи сессий БД
+        concurrency_limit = ConcurrencyLimitMiddleware()
+        dp.update.outer_middleware(concurrency_limit)
         dp.message.middleware(DBSessionMiddleware())
         dp.callback_query.middleware(DBSessionMiddleware())
         dp.my_chat_member.middleware(DBSessionMiddleware())
@@ -53,7 +75,7 @@ async def main():
         # Настройка обработчика ошибок
         setup_error_handler(dp, bot)
 
-        # Запуск поллинга
+        # Запуск поллинга или вебхука
         allowed_updates = ["message", "callback_query", "my_chat_member", "chat_member"]
         # Команды в интерфейсе Telegram
         await bot.set_my_commands(
@@ -61,18 +83,39 @@ async def main():
                 BotCommand(command="start", description="Run, drink, repeat!"),
             ]
         )
-        logger.info("Бот запущен")
-        await dp.start_polling(bot, allowed_updates=allowed_updates)
+
+        def collect_metrics() -> dict:
+            return {
+                "handlers": concurrency_limit.snapshot(),
+                "single_flight": single_flight_stats(),
+            }
+
+        if settings.BOT_MODE == "webhook":
+            logger.info("Бот запущен в режиме вебхука")
+            await run_webhook(bot, dp, allowed_updates, metrics=collect_metrics)
+        else:
+            metrics_logger = asyncio.create_task(
+                log_metrics(collect_metrics, settings.METRICS_LOG_INTERVAL)
+            )
+            await bot.delete_webhook()
+            logger.info("Бот запущен")
+            await dp.start_polling(bot, allowed_updates=allowed_updates)
 
     except Exception as e:
         logger.error(f"Критическая ошибка при запуске бота: {e}")
         raise
     finally:
         # Закрытие соединений
+        if "metrics_logger" in locals():
+            metrics_logger.cancel()
+        if "cache_listener" in locals():
+            cache_listener.cancel()
+            await close_redis()
         if "redis" in locals():
             await redis.close()
         if "bot" in locals():
             await bot.session.close()
+        await dispose_engine()
 
 
 if __name__ == "__main__":
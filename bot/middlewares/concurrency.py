@@ -0,0 +1,92 @@
+import asyncio
+from typing import Callable, Dict
+
+from aiogram import BaseMiddleware
+from aiogram.types import Update
+
+from bot.logger import setup_logger
+from bot.texts import BUSY_TRY_LATER
+from shared.config import settings
+
+logger = setup_logger(__name__)
+
+
+class ConcurrencyLimitMiddleware(BaseMiddleware):
+    """
+    Ограничивает число одновременно обрабатываемых обновлений.
+
+    Лишние обновления ждут своей очереди, чтобы всплеск не исчерпал пул
+    соединений с БД. Если ждущих больше `max_waiting`, обновление отбрасывается,
+    а пользователю отвечают просьбой повторить позже.
+    """
+
+    def __init__(
+        self,
+        limit: int = settings.HANDLER_CONCURRENCY,
+        max_waiting: int = settings.HANDLER_MAX_WAITING,
+    ):
+        self.limit = limit
+        self.max_waiting = max_waiting
+        self._semaphore = asyncio.Semaphore(limit)
+        self.active = 0
+        self.waiting = 0
+        self.peak_waiting = 0
+        self.processed = 0
+        self.shed = 0
+
+    async def __call__(self, handler, event, data):
+        if self._semaphore.locked() and self.waiting >= self.max_waiting:
+            self.shed += 1
+            await self._reject(event)
+            return None
+        self.waiting += 1
+        self.peak_waiting = max(self.peak_waiting, self.waiting)
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        self.active += 1
+        try:
+            return await handler(event, data)
+        finally:
+            self.active -= 1
+            self.processed += 1
+            self._semaphore.release()
+
+    @staticmethod
+    async def _reject(event):
+        try:
+            if isinstance(event, Update) and event.callback_query:
+                await event.callback_query.answer(BUSY_TRY_LATER)
+            elif (
+                isinstance(event, Update)
+                and event.message
+                and event.message.chat.type == "private"
+            ):
+                await event.message.answer(BUSY_TRY_LATER)
+        except Exception as e:
+            logger.debug("Не удалось ответить на отброшенное обновление: %s", e)
+
+    def snapshot(self) -> Dict[str, int]:
+        return {
+            "limit": self.limit,
+            "active": self.active,
+            "waiting": self.waiting,
+            "peak_waiting": self.peak_waiting,
+            "processed": self.processed,
+            "shed": self.shed,
+        }
+
+
+async def log_metrics(collect: Callable[[], dict], interval: float = 60):
+    """Периодически пишет метрики в лог (для режима поллинга, где нет /metrics)."""
+    last_shed = 0
+    while True:
+        await asyncio.sleep(interval)
+        metrics = collect()
+        handlers = metrics.get("handlers", {})
+        if handlers.get("shed", 0) > last_shed:
+            logger.warning(f"Отброшены обновления под нагрузкой: {metrics}")
+        else:
+            logger.info(f"Метрики обработки: {metrics}")
+        last_shed = handlers.get("shed", 0)
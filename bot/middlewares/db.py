@@ -1,13 +1,13 @@
 from aiogram import BaseMiddleware
-from sqlalchemy.ext.asyncio import AsyncSession
 from db.database import get_async_session_maker
-import asyncio
 
 
 class DBSessionMiddleware(BaseMiddleware):
     async def __call__(self, handler, event, data):
-        loop = asyncio.get_event_loop()
-        session_maker = get_async_session_maker(loop)
+        # Фабрика и пул соединений общие для цикла событий — создаются один раз
+        session_maker = get_async_session_maker()
+        # AsyncSession берёт соединение из пула только при первом запросе,
+        # поэтому обработчики без обращений к БД пул не занимают
         async with session_maker() as session:
             data["session"] = session
             return await handler(event, data)
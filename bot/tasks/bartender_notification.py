@@ -1,32 +1,32 @@
 import os
-import asyncio
+from typing import Optional
 from celery import shared_task
-from aiogram import Bot, types
-from aiogram.utils.keyboard import InlineKeyboardBuilder
+from aiogram import Bot
 from sqlalchemy.ext.asyncio import AsyncSession
-from bot.core.repositories.event_repository import EventRepository
-from bot.core.repositories.user_repository import UserRepository
+from bot.core.repositories.event_repository import (
+    EVENT_DELETED,
+    EventRepository,
+    get_event_generation,
+)
 from bot.core.repositories.beer_repository import BeerRepository
-from bot.texts import BARTENDER_NOTIFICATION, EVENT_NOTIFICATION_TEXT
+from bot.texts import BARTENDER_NOTIFICATION
+from bot.broadcast import (
+    BROADCAST_RATE,
+    event_broadcast_id,
+    pending_recipient_pages,
+    send_event_notifications,
+)
 from bot.logger import setup_logger
 from db.database import get_async_session_context
-from aiogram.exceptions import TelegramAPIError
+from bot.tasks.idempotency import idempotent
+from bot.tasks.runtime import runtime
 from db.models import Event
 
 logger = setup_logger(__name__)
 
-BOT_TOKEN = os.getenv("BOT_TOKEN")
 ADMIN_TELEGRAM_ID = int(os.getenv("ADMIN_TELEGRAM_ID", "0"))
-
-
-def get_command_keyboard():
-    builder = InlineKeyboardBuilder()
-    builder.add(
-        types.InlineKeyboardButton(text="🍺 Выбрать пиво", callback_data="cmd_beer")
-    )
-    builder.add(types.InlineKeyboardButton(text="👤 Профиль", callback_data="profile"))
-    builder.adjust(2)
-    return builder.as_markup()
+# Процессов воркера очереди broadcast: общий лимит Telegram делится между ними
+BROADCAST_WORKER_PROCESSES = int(os.getenv("BROADCAST_WORKER_PROCESSES", "2"))
 
 
 async def send_bartender_notification(bot: Bot, event: Event, session: AsyncSession):
@@ -59,122 +59,124 @@ async def send_bartender_notification(bot: Bot, event: Event, session: AsyncSess
         )
 
 
-async def send_event_notifications(bot: Bot, event: Event, session: AsyncSession):
-    users = await UserRepository.get_all_users(session, limit=1000)
-    notification_text = EVENT_NOTIFICATION_TEXT.format(
-        name=event.name,
-        date=event.event_date.strftime("%d.%m.%Y"),
-        time=event.event_time.strftime("%H:%M"),
-        location=event.location_name or "Не указано",
-        description=event.description or "Не указано",
-        beer_options=(
-            f"{event.beer_option_1}, {event.beer_option_2}"
-            if event.has_beer_choice
-            else "Лагер"
-        ),
-    )
-    successful_sends = 0
-    failed_sends = 0
-    for user in users:
-        try:
-            if event.image_file_id:
-                await bot.send_photo(
-                    chat_id=user.telegram_id,
-                    photo=event.image_file_id,
-                    caption=notification_text,
-                    reply_markup=get_command_keyboard(),
-                )
-            else:
-                await bot.send_message(
-                    chat_id=user.telegram_id,
-                    text=notification_text,
-                    reply_markup=get_command_keyboard(),
-                )
-            successful_sends += 1
-        except TelegramAPIError as e:
-            logger.warning(
-                f"Failed to send notification to user {user.telegram_id}: {e}"
-            )
-            failed_sends += 1
-        except Exception as e:
-            logger.error(
-                f"Unexpected error sending notification to user {user.telegram_id}: {e}"
-            )
-            failed_sends += 1
-    logger.info(
-        f"Event notifications sent: {successful_sends} successful, {failed_sends} failed"
-    )
+async def load_current_event(
+    session: AsyncSession, event_id: int, version: Optional[int]
+) -> Optional[Event]:
+    """
+    Возвращает событие, если задача относится к его текущему поколению.
+    Удалённые и перенесённые события отсекаются по Redis без запроса к БД.
+    """
+    generation = await get_event_generation(event_id)
+    if generation == EVENT_DELETED:
+        logger.info(f"Событие {event_id} удалено, задача пропущена")
+        return None
+    if version is not None and generation is not None and generation != version:
+        logger.info(
+            f"Событие {event_id} перенесено (поколение {generation}), задача поколения {version} пропущена"
+        )
+        return None
+    event = await EventRepository.get_event_by_id(session, event_id)
+    if not event:
+        logger.info(f"Событие {event_id} не найдено, задача пропущена")
+        return None
+    if version is not None and event.version != version:
+        logger.info(
+            f"Событие {event_id} перенесено (поколение {event.version}), задача поколения {version} пропущена"
+        )
+        return None
+    return event
+
+
+def event_task_key(event_id: int, version: Optional[int] = None) -> str:
+    return f"{event_id}:{version}"
 
 
 @shared_task(bind=True, ignore_result=True)
-def process_user_notification(self, event_id: int):
+@idempotent(event_task_key)
+def process_user_notification(self, event_id: int, version: Optional[int] = None):
+    """Делит рассылку анонса на страницы получателей и ставит их подзадачами."""
     logger.info(f"Запуск задачи уведомления пользователей для события {event_id}")
+
+    async def main() -> tuple[int, int]:
+        pages = recipients = 0
+        async with get_async_session_context() as session:
+            event = await load_current_event(session, event_id, version)
+            if not event:
+                return pages, recipients
+            # Страница уходит в очередь сразу после чтения — в памяти только одна
+            async for page in pending_recipient_pages(
+                session, event_broadcast_id(event_id, event.version)
+            ):
+                send_user_notification_chunk.apply_async(args=(event_id, version, page))
+                pages += 1
+                recipients += len(page)
+        return pages, recipients
+
     try:
-        loop = asyncio.get_event_loop()
-        if loop.is_closed():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        pages, recipients = runtime.run(main())
+    except Exception as e:
+        logger.error(
+            f"Ошибка в задаче уведомления пользователей для события {event_id}: {e}",
+            exc_info=True,
+        )
+        raise self.retry(exc=e, countdown=60, max_retries=3)
+    if pages:
+        logger.info(
+            f"Рассылка события {event_id}: {recipients} получателей в {pages} подзадачах"
+        )
+
+
+@shared_task(bind=True, ignore_result=True)
+def send_user_notification_chunk(
+    self, event_id: int, version: Optional[int], chat_ids: list[int]
+):
+    """Рассылает анонс странице получателей."""
 
     async def main():
-        bot = Bot(token=BOT_TOKEN)
-        try:
-            async with get_async_session_context(loop=loop) as session:
-                event = await EventRepository.get_event_by_id(session, event_id)
-                if not event:
-                    logger.error(f"Событие {event_id} не найдено")
-                    return
-                await send_event_notifications(bot, event, session)
-        except Exception as e:
-            logger.error(
-                f"Ошибка в задаче уведомления пользователей для события {event_id}: {e}",
-                exc_info=True,
+        async with get_async_session_context() as session:
+            event = await load_current_event(session, event_id, version)
+            if not event:
+                return
+            return await send_event_notifications(
+                runtime.bot,
+                event,
+                session,
+                chat_ids=chat_ids,
+                rate=BROADCAST_RATE / BROADCAST_WORKER_PROCESSES,
             )
-            raise self.retry(exc=e, countdown=60, max_retries=3)
-        finally:
-            await bot.session.close()
 
     try:
-        loop.run_until_complete(main())
-    finally:
-        if not loop.is_closed():
-            loop.close()
+        stats = runtime.run(main())
+    except Exception as e:
+        logger.error(
+            f"Ошибка подзадачи рассылки события {event_id}: {e}", exc_info=True
+        )
+        raise self.retry(exc=e, countdown=60, max_retries=3)
+    # Доставленные получатели отмечены в журнале — повтор дойдёт только до остальных
+    if stats and stats.failed:
+        logger.warning(
+            f"Рассылка события {event_id}: {stats.failed} получателей не доставлено, повтор"
+        )
+        raise self.retry(countdown=60, max_retries=3)
 
 
 @shared_task(bind=True, ignore_result=True)
-def process_bartender_notification(self, event_id: int):
+@idempotent(event_task_key)
+def process_bartender_notification(self, event_id: int, version: Optional[int] = None):
     logger.info(f"Запуск задачи уведомления бармена для события {event_id}")
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_closed():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
 
     async def main():
-        bot = Bot(token=BOT_TOKEN)
-        try:
-            async with get_async_session_context(loop=loop) as session:
-                event = await EventRepository.get_event_by_id(session, event_id)
-                if not event:
-                    logger.error(f"Событие {event_id} не найдено")
-                    return
-                await send_bartender_notification(bot, event, session)
-        except Exception as e:
-            logger.error(
-                f"Ошибка в задаче уведомления бармена для события {event_id}: {e}",
-                exc_info=True,
-            )
-            raise self.retry(exc=e, countdown=60, max_retries=3)
-        finally:
-            await bot.session.close()
+        async with get_async_session_context() as session:
+            event = await load_current_event(session, event_id, version)
+            if not event:
+                return
+            await send_bartender_notification(runtime.bot, event, session)
 
     try:
-        loop.run_until_complete(main())
-    finally:
-        if not loop.is_closed():
-            loop.close()
+        runtime.run(main())
+    except Exception as e:
+        logger.error(
+            f"Ошибка в задаче уведомления бармена для события {event_id}: {e}",
+            exc_info=True,
+        )
+        raise self.retry(exc=e, countdown=60, max_retries=3)
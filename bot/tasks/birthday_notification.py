@@ -1,5 +1,3 @@
-import os
-import asyncio
 from celery import shared_task
 from aiogram import Bot
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -7,14 +5,14 @@ from bot.core.repositories.user_repository import UserRepository
 from bot.texts import BIRTHDAY_NOTIFICATION
 from bot.logger import setup_logger
 from db.database import get_async_session_context
+from bot.tasks.idempotency import idempotent
+from bot.tasks.runtime import runtime
 from pendulum import now
 
 from db.models import User
 
 logger = setup_logger(__name__)
 
-BOT_TOKEN = os.getenv("BOT_TOKEN")
-
 
 async def send_birthday_notification(bot: Bot, user: User, session: AsyncSession):
     if not user.birth_date or not user.registered_from_group_id:
@@ -22,9 +20,6 @@ async def send_birthday_notification(bot: Bot, user: User, session: AsyncSession
             f"Пропущен пользователь {user.telegram_id}: нет даты рождения или группы"
         )
         return
-    today = now("Europe/Moscow")
-    if user.birth_date.day != today.day or user.birth_date.month != today.month:
-        return
     message_text = BIRTHDAY_NOTIFICATION.format(name=user.username)
     try:
         await bot.send_message(chat_id=user.registered_from_group_id, text=message_text)
@@ -38,32 +33,19 @@ async def send_birthday_notification(bot: Bot, user: User, session: AsyncSession
 
 
 @shared_task(bind=True, ignore_result=True)
+@idempotent(lambda: now("Europe/Moscow").to_date_string(), done_ttl=2 * 24 * 3600)
 def process_birthday_notifications(self):
     logger.info("Запуск задачи проверки дней рождения")
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_closed():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
 
     async def main():
-        bot = Bot(token=BOT_TOKEN)
-        try:
-            async with get_async_session_context(loop=loop) as session:
-                users = await UserRepository.get_all_users(session, limit=1000)
-                for user in users:
-                    await send_birthday_notification(bot, user, session)
-        except Exception as e:
-            logger.error(f"Ошибка в задаче проверки дней рождения: {e}", exc_info=True)
-            raise self.retry(exc=e, countdown=60, max_retries=3)
-        finally:
-            await bot.session.close()
+        async with get_async_session_context() as session:
+            today = now("Europe/Moscow").date()
+            users = await UserRepository.get_birthday_users(session, today)
+            for user in users:
+                await send_birthday_notification(runtime.bot, user, session)
 
     try:
-        loop.run_until_complete(main())
-    finally:
-        if not loop.is_closed():
-            loop.close()
+        runtime.run(main())
+    except Exception as e:
+        logger.error(f"Ошибка в задаче проверки дней рождения: {e}", exc_info=True)
+        raise self.retry(exc=e, countdown=60, max_retries=3)
@@ -1,5 +1,6 @@
 from celery import Celery
 from celery.schedules import crontab
+from kombu import Exchange, Queue
 from bot.logger import setup_logger
 import os
 from dotenv import load_dotenv
@@ -10,6 +11,13 @@ logger = setup_logger(__name__)
 REDIS_URL = os.getenv("REDIS_URL", "redis://redis:6379/0")
 
 BIRTHDAY_CHECK_TIME = os.getenv("BIRTHDAY_CHECK_TIME", "17:58")
+BEER_COUNTERS_RECONCILE_TIME = os.getenv("BEER_COUNTERS_RECONCILE_TIME", "04:00")
+# Как часто проверять наступившие отложенные задачи, в секундах
+SCHEDULER_TICK_SECONDS = float(os.getenv("SCHEDULER_TICK_SECONDS", "15"))
+
+
+# Очереди воркеров; "celery" — прежняя очередь по умолчанию (см. task_queues)
+QUEUE_NAMES = ("realtime", "broadcast", "default", "celery")
 
 
 def parse_time(time_str: str) -> dict:
@@ -27,12 +35,19 @@ def parse_time(time_str: str) -> dict:
 
 
 BIRTHDAY_CHECK_CRONTAB = parse_time(BIRTHDAY_CHECK_TIME)
+BEER_COUNTERS_RECONCILE_CRONTAB = parse_time(BEER_COUNTERS_RECONCILE_TIME)
 
 app = Celery(
     "bot",
     broker=REDIS_URL,
     backend=REDIS_URL,
-    include=["bot.tasks.bartender_notification", "bot.tasks.birthday_notification"],
+    include=[
+        "bot.tasks.runtime",
+        "bot.tasks.bartender_notification",
+        "bot.tasks.birthday_notification",
+        "bot.tasks.maintenance",
+        "bot.tasks.scheduler",
+    ],
 )
 
 app.conf.update(
@@ -43,12 +58,58 @@ app.conf.update(
     enable_utc=False,
     broker_connection_retry_on_startup=True,
     result_expires=3600,  # Expire task results after 1 hour
+    # Воркер не набирает задачи впрок — срочные не ждут за длинными
+    worker_prefetch_multiplier=1,
+    task_default_queue="default",
+    # "celery" — очередь по умолчанию до разделения: в ней лежат ETA-задачи
+    # уведомлений, поставленные до перехода на scheduled_jobs. Воркер default
+    # дочитывает её, пока эти события не пройдут
+    task_queues=tuple(
+        # У каждой очереди свой обменник и ключ: без них все очереди
+        # привязаны к одному ключу и получают копию каждой задачи
+        Queue(name, Exchange(name, type="direct"), routing_key=name)
+        for name in QUEUE_NAMES
+    ),
+    task_routes={
+        # Уведомление бармена и планировщик должны срабатывать вовремя
+        "bot.tasks.bartender_notification.process_bartender_notification": {
+            "queue": "realtime",
+            "priority": 0,
+        },
+        "bot.tasks.scheduler.dispatch_due_jobs": {"queue": "realtime", "priority": 0},
+        "bot.tasks.bartender_notification.process_user_notification": {
+            "queue": "broadcast",
+            "priority": 3,
+        },
+        "bot.tasks.bartender_notification.send_user_notification_chunk": {
+            "queue": "broadcast",
+            "priority": 5,
+        },
+        "bot.tasks.birthday_notification.*": {"queue": "default"},
+        "bot.tasks.maintenance.*": {"queue": "default", "priority": 9},
+    },
+    # В Redis меньшее число — более высокий приоритет
+    broker_transport_options={
+        "priority_steps": list(range(10)),
+        "queue_order_strategy": "priority",
+        "sep": ":",
+    },
 )
 app.conf.beat_schedule = {
     "send-birthday-notifications": {
         "task": "bot.tasks.birthday_notification.process_birthday_notifications",
         "schedule": crontab(**BIRTHDAY_CHECK_CRONTAB),
     },
+    "reconcile-beer-counters": {
+        "task": "bot.tasks.maintenance.reconcile_beer_counters",
+        "schedule": crontab(**BEER_COUNTERS_RECONCILE_CRONTAB),
+    },
+    "dispatch-due-jobs": {
+        "task": "bot.tasks.scheduler.dispatch_due_jobs",
+        "schedule": SCHEDULER_TICK_SECONDS,
+        # Пропущенный тик не нужен: следующий заберёт те же задачи
+        "options": {"expires": SCHEDULER_TICK_SECONDS},
+    },
 }
 
 if __name__ == "__main__":
@@ -0,0 +1,82 @@
+import functools
+import os
+import uuid
+from typing import Callable, Optional
+
+from redis import Redis, RedisError
+
+from bot.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://redis:6379/0")
+
+# Снимает блокировку, только если она всё ещё принадлежит этому запуску
+_RELEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+_client: Optional[Redis] = None
+
+
+def get_sync_redis() -> Redis:
+    """Возвращает синхронный клиент Redis процесса воркера."""
+    global _client
+    if _client is None:
+        _client = Redis.from_url(REDIS_URL)
+    return _client
+
+
+def idempotent(
+    key: Callable[..., str], lock_ttl: int = 600, done_ttl: int = 7 * 24 * 3600
+):
+    """
+    Не даёт задаче Celery выполниться повторно для одного и того же ключа.
+
+    `key` получает аргументы задачи и возвращает ключ дедупликации, например
+    id события или дату. Пока задача выполняется, ключ держит короткая
+    блокировка (`lock_ttl`); после успешного завершения ставится маркер
+    выполнения на `done_ttl` секунд. Дубликат при живой блокировке или маркере
+    завершается сразу, не трогая БД и Telegram. При ошибке и `self.retry`
+    блокировка снимается, а маркер не ставится — повтор выполнится.
+    Если Redis недоступен, задача выполняется без защиты.
+    """
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            dedup_key = f"task:{self.name}:{key(*args, **kwargs)}"
+            lock_key, done_key = f"{dedup_key}:lock", f"{dedup_key}:done"
+            token = uuid.uuid4().hex
+            client = get_sync_redis()
+            try:
+                if client.exists(done_key):
+                    logger.info(f"Задача {dedup_key} уже выполнена, дубликат пропущен")
+                    return None
+                if not client.set(lock_key, token, nx=True, ex=lock_ttl):
+                    logger.info(
+                        f"Задача {dedup_key} уже выполняется, дубликат пропущен"
+                    )
+                    return None
+            except RedisError as e:
+                logger.warning(f"Redis недоступен для дедупликации {dedup_key}: {e}")
+                return fn(self, *args, **kwargs)
+            try:
+                result = fn(self, *args, **kwargs)
+                try:
+                    client.set(done_key, 1, ex=done_ttl)
+                except RedisError as e:
+                    logger.warning(f"Не удалось отметить выполнение {dedup_key}: {e}")
+                return result
+            finally:
+                try:
+                    client.eval(_RELEASE_SCRIPT, 1, lock_key, token)
+                except RedisError as e:
+                    logger.warning(f"Не удалось снять блокировку {lock_key}: {e}")
+
+        return wrapper
+
+    return decorator
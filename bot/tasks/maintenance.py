@@ -0,0 +1,23 @@
+from celery import shared_task
+from bot.core.repositories.beer_repository import BeerRepository
+from bot.logger import setup_logger
+from db.database import get_async_session_context
+from bot.tasks.runtime import runtime
+
+logger = setup_logger(__name__)
+
+
+@shared_task(bind=True, ignore_result=True)
+def reconcile_beer_counters(self):
+    """Сверяет счётчики заказов пива с таблицей выборов."""
+    logger.info("Запуск сверки счётчиков заказов пива")
+
+    async def main():
+        async with get_async_session_context() as session:
+            return await BeerRepository.reconcile_beer_counters(session)
+
+    try:
+        runtime.run(main())
+    except Exception as e:
+        logger.error(f"Ошибка сверки счётчиков заказов пива: {e}", exc_info=True)
+        raise self.retry(exc=e, countdown=300, max_retries=3)
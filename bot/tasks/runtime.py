@@ -0,0 +1,99 @@
+import asyncio
+import os
+import threading
+from typing import Awaitable, Optional, TypeVar
+
+from aiogram import Bot
+from celery.signals import worker_process_init, worker_process_shutdown, worker_shutdown
+
+from bot.logger import setup_logger
+from db.database import dispose_all_engines, dispose_engine, get_async_engine
+
+logger = setup_logger(__name__)
+
+BOT_TOKEN = os.getenv("BOT_TOKEN")
+
+T = TypeVar("T")
+
+
+class AsyncRuntime:
+    """
+    Долгоживущий цикл событий воркера Celery.
+
+    Цикл крутится в фоновом потоке, владеет общим `Bot` и пулом соединений
+    с БД; задачи отправляют в него корутины через `run`.
+    """
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._bot: Optional[Bot] = None
+        self._lock = threading.Lock()
+
+    @property
+    def bot(self) -> Bot:
+        if self._bot is None:
+            raise RuntimeError("Async runtime is not started")
+        return self._bot
+
+    def start(self):
+        with self._lock:
+            if self._loop is not None:
+                return
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=self._run_loop, args=(loop,), name="celery-async", daemon=True
+            )
+            thread.start()
+            self._loop, self._thread = loop, thread
+            self._bot = Bot(token=BOT_TOKEN)
+            # Пул создаётся заранее, чтобы первая задача не платила за него
+            get_async_engine(loop)
+            logger.info(f"Async runtime запущен (pid={os.getpid()})")
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop):
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+
+    def run(self, coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """Выполняет корутину в цикле воркера и блокирует до результата."""
+        if self._loop is None:
+            self.start()
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        return future.result(timeout)
+
+    def stop(self):
+        with self._lock:
+            if self._loop is None:
+                return
+            loop, thread, bot = self._loop, self._thread, self._bot
+            self._loop = self._thread = self._bot = None
+
+        async def shutdown():
+            await bot.session.close()
+            await dispose_engine(loop)
+
+        try:
+            asyncio.run_coroutine_threadsafe(shutdown(), loop).result(10)
+        except Exception as e:
+            logger.error(f"Ошибка при остановке async runtime: {e}", exc_info=True)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=10)
+        loop.close()
+        logger.info(f"Async runtime остановлен (pid={os.getpid()})")
+
+
+runtime = AsyncRuntime()
+
+
+@worker_process_init.connect
+def start_runtime(**kwargs):
+    runtime.start()
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def stop_runtime(**kwargs):
+    runtime.stop()
+    dispose_all_engines()
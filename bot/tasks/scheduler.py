@@ -0,0 +1,49 @@
+from celery import shared_task
+from bot.core.repositories.scheduled_job_repository import ScheduledJobRepository
+from bot.logger import setup_logger
+from db.database import get_async_session_context
+from bot.tasks.runtime import runtime
+
+logger = setup_logger(__name__)
+
+# Сколько задач ставится в очередь за один тик
+DISPATCH_BATCH_SIZE = 100
+
+
+@shared_task(bind=True, ignore_result=True)
+def dispatch_due_jobs(self):
+    """
+    Ставит в очередь Celery задачи из scheduled_jobs, время которых наступило.
+
+    Строки блокируются до коммита, поэтому параллельные тики не отправят одну
+    задачу дважды. Если процесс упадёт между отправкой и коммитом, задача уйдёт
+    повторно с тем же task_id.
+    """
+
+    async def main() -> int:
+        dispatched = 0
+        while True:
+            async with get_async_session_context() as session:
+                jobs = await ScheduledJobRepository.claim_due_jobs(
+                    session, limit=DISPATCH_BATCH_SIZE
+                )
+                enqueued = []
+                for job in jobs:
+                    try:
+                        self.app.send_task(
+                            job.task_name, args=job.args, task_id=job.task_id
+                        )
+                        enqueued.append(job.id)
+                    except Exception as e:
+                        logger.error(
+                            f"Не удалось поставить в очередь задачу {job.id} ({job.task_name}): {e}",
+                            exc_info=True,
+                        )
+                await ScheduledJobRepository.mark_enqueued(session, enqueued)
+            dispatched += len(enqueued)
+            if len(jobs) < DISPATCH_BATCH_SIZE or len(enqueued) < len(jobs):
+                return dispatched
+
+    dispatched = runtime.run(main())
+    if dispatched:
+        logger.info(f"Поставлено в очередь отложенных задач: {dispatched}")
@@ -73,6 +73,24 @@ EVENT_CANCEL_SUCCESS = "❌ Создание события отменено."
 EVENT_NOTIFICATION_TEXT = "🎉 Новое событие!\n\n📝 {name}\n📅 {date}\n🕐 {time}\n📍 {location}\n📖 {description}\n🍺 Пиво: {beer_options}\n\nУвидимся на событии! 🎊"
 EVENT_NOTIFICATION_SUMMARY = "🎉 Событие создано!\n\n📝 Название: {name}\n📅 Дата: {date}\n🕐 Время: {time}\n📍 Место: {location}\n📖 Описание: {description}\n🖼️ Изображение: {image}\n🍺 Выбор пива: {beer_choice}\n🍻 Варианты: {beer_options}\n"
 EVENT_CREATED = "🎉 Событие успешно создано!"
+# Тексты для переноса события
+EVENT_RESCHEDULE_NO_EVENTS = "❌ Нет предстоящих событий для переноса."
+EVENT_RESCHEDULE_SELECT = "📅 Выберите событие для переноса:"
+EVENT_RESCHEDULE_DATE_PROMPT = "✅ Событие: {name}\n\n📅 Введите новую дату события в формате ДД.ММ.ГГГГ\nНапример: 15.12.2025"
+EVENT_RESCHEDULE_TIME_PROMPT = (
+    "✅ Дата: {date}\n\n🕐 Введите новое время события в формате ЧЧ:ММ\nНапример: 14:15"
+)
+EVENT_RESCHEDULE_CANCELLED = "❌ Перенос события отменён."
+# Тексты для удаления события
+EVENT_DELETE_NO_EVENTS = "❌ Нет предстоящих событий для удаления."
+EVENT_DELETE_SELECT = "🗑 Выберите событие для удаления:"
+EVENT_DELETE_CONFIRM = "Удалить событие «{name}» ({date} {time})? Запланированные уведомления будут отменены."
+EVENT_DELETE_SUCCESS = "🗑 Событие «{name}» удалено, уведомления отменены."
+EVENT_DELETE_CANCELLED = "❌ Удаление события отменено."
+EVENT_RESCHEDULE_PAST = "❌ Новое время события уже прошло. Попробуйте еще раз:"
+EVENT_RESCHEDULED = (
+    "✅ Событие «{name}» перенесено на {date} {time}. Уведомления запланированы заново."
+)
 # Тексты для выбора пива
 BEER_NO_EVENTS = "❌ Нет актуальных событий для выбора пива."
 BEER_EVENT_LIST = "📅 Выберите событие для выбора пива:"
@@ -85,6 +103,7 @@ BEER_INVALID_LOCATION = "❌ Отправьте геопозицию через
 BEER_CHOICE_PROMPT = "🍺 Выберите пиво:"
 BEER_CHOICE_SUCCESS = "✅ Отличный выбор: {beer}!"
 BEER_ERROR = "❌ Ошибка: {error}"
+BUSY_TRY_LATER = "⏳ Бот сейчас перегружен. Попробуйте ещё раз через минуту."
 # Тексты для профиля
 PROFILE_NOT_REGISTERED = (
     "❌ Вы не зарегистрированы. Пройдите регистрацию через команду /start."
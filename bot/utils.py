@@ -0,0 +1,42 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+_single_flights: Dict[str, "SingleFlight"] = {}
+
+
+class SingleFlight:
+    """
+    Объединяет одновременные одинаковые чтения.
+
+    Пока запрос по ключу выполняется, остальные вызовы с тем же ключом ждут его
+    результат вместо собственного запроса. Кэша нет: после завершения ключ
+    освобождается и следующий вызов снова идёт в базу.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.coalesced = 0
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        _single_flights[name] = self
+
+    def _forget(self, key: Hashable, future: asyncio.Future):
+        if self._calls.get(key) is future:
+            del self._calls[key]
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        future = self._calls.get(key)
+        if future is not None:
+            self.coalesced += 1
+        else:
+            future = asyncio.ensure_future(fn())
+            self._calls[key] = future
+            future.add_done_callback(lambda f: self._forget(key, f))
+        # Отмена одного ожидающего не должна прерывать запрос для остальных
+        return await asyncio.shield(future)
+
+
+def single_flight_stats() -> Dict[str, int]:
+    """Сколько вызовов было объединено, по имени группы."""
+    return {name: flight.coalesced for name, flight in _single_flights.items()}
@@ -0,0 +1,197 @@
+import asyncio
+import signal
+import sys
+from typing import Any, Callable, Dict, Optional
+
+from aiogram import Bot, Dispatcher
+from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_application
+from aiohttp import web
+
+from bot.logger import setup_logger
+from shared.config import settings
+
+logger = setup_logger(__name__)
+
+
+class QueuedRequestHandler(SimpleRequestHandler):
+    """
+    Обработчик вебхука с ограниченной очередью обновлений.
+
+    Запрос Telegram подтверждается сразу после постановки в очередь, а обновления
+    разбирают `workers` параллельных воркеров. Если очередь заполнена, отвечаем
+    503 — Telegram повторит доставку позже. При остановке очередь дорабатывается.
+    """
+
+    def __init__(
+        self,
+        dispatcher: Dispatcher,
+        bot: Bot,
+        secret_token: Optional[str] = None,
+        workers: int = settings.WEBHOOK_WORKERS,
+        queue_size: int = settings.WEBHOOK_QUEUE_SIZE,
+        drain_timeout: float = settings.WEBHOOK_DRAIN_TIMEOUT,
+        **data: Any,
+    ):
+        super().__init__(
+            dispatcher=dispatcher,
+            bot=bot,
+            handle_in_background=True,
+            secret_token=secret_token,
+            **data,
+        )
+        self.workers = workers
+        self.drain_timeout = drain_timeout
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.processed = 0
+        self.rejected = 0
+        self._worker_tasks: list[asyncio.Task] = []
+        self._accepting = True
+
+    def register(self, app: web.Application, /, path: str, **kwargs: Any) -> None:
+        app.on_startup.append(self._start_workers)
+        super().register(app, path=path, **kwargs)
+
+    async def _start_workers(self, app: web.Application):
+        self._worker_tasks = [
+            asyncio.create_task(self._worker()) for _ in range(self.workers)
+        ]
+        logger.info(
+            f"Запущено {self.workers} воркеров вебхука, очередь {self.queue.maxsize}"
+        )
+
+    async def _worker(self):
+        while True:
+            update = await self.queue.get()
+            try:
+                await self._background_feed_update(bot=self.bot, update=update)
+                self.processed += 1
+            except Exception as e:
+                logger.error(f"Ошибка обработки обновления: {e}", exc_info=True)
+            finally:
+                self.queue.task_done()
+
+    async def _handle_request_background(
+        self, bot: Bot, request: web.Request
+    ) -> web.Response:
+        if not self._accepting:
+            return web.Response(status=503)
+        update: Dict[str, Any] = await request.json(loads=bot.session.json_loads)
+        try:
+            self.queue.put_nowait(update)
+        except asyncio.QueueFull:
+            self.rejected += 1
+            logger.warning("Очередь вебхука заполнена, обновление отклонено")
+            return web.Response(status=503)
+        return web.json_response({}, dumps=bot.session.json_dumps)
+
+    async def drain(self):
+        """Перестаёт принимать обновления и дорабатывает очередь."""
+        self._accepting = False
+        try:
+            await asyncio.wait_for(self.queue.join(), timeout=self.drain_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Очередь вебхука не опустела за {self.drain_timeout} с, "
+                f"осталось {self.queue.qsize()} обновлений"
+            )
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        logger.info(f"Вебхук остановлен, обработано обновлений: {self.processed}")
+
+    def snapshot(self) -> Dict[str, int]:
+        return {
+            "queued": self.queue.qsize(),
+            "queue_size": self.queue.maxsize,
+            "processed": self.processed,
+            "rejected": self.rejected,
+        }
+
+    async def close(self) -> None:
+        await self.drain()
+        await super().close()
+
+
+async def run_webhook(
+    bot: Bot,
+    dp: Dispatcher,
+    allowed_updates: list[str],
+    metrics: Optional[Callable[[], dict]] = None,
+):
+    """
+    Запускает aiohttp-сервер вебхука и ждёт SIGINT/SIGTERM.
+
+    На `GET /metrics` отдаются счётчики очереди вебхука и то, что вернёт `metrics`.
+    Без `WEBHOOK_SECRET` сервер не запускается: иначе он принял бы любой POST.
+    """
+    if not settings.WEBHOOK_SECRET:
+        raise RuntimeError("WEBHOOK_SECRET must be set in webhook mode")
+    app = web.Application()
+    handler = QueuedRequestHandler(
+        dispatcher=dp, bot=bot, secret_token=settings.WEBHOOK_SECRET
+    )
+    handler.register(app, path=settings.WEBHOOK_PATH)
+
+    async def metrics_view(request: web.Request) -> web.Response:
+        payload = {"webhook": handler.snapshot()}
+        if metrics is not None:
+            payload.update(metrics())
+        return web.json_response(payload)
+
+    app.router.add_get("/metrics", metrics_view)
+    setup_application(app, dp, bot=bot)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, settings.WEBHOOK_HOST, settings.WEBHOOK_PORT)
+    await site.start()
+    logger.info(
+        f"Вебхук слушает {settings.WEBHOOK_HOST}:{settings.WEBHOOK_PORT}{settings.WEBHOOK_PATH}"
+    )
+
+    if settings.WEBHOOK_URL:
+        await bot.set_webhook(
+            url=settings.WEBHOOK_URL.rstrip("/") + settings.WEBHOOK_PATH,
+            secret_token=settings.WEBHOOK_SECRET,
+            allowed_updates=allowed_updates,
+        )
+        logger.info("Вебхук зарегистрирован в Telegram")
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+    try:
+        await stop.wait()
+    finally:
+        await runner.cleanup()
+
+
+async def send_fake_update(url: str, text: str = "/start", chat_id: int = 1):
+    """
+    Отправляет на вебхук обновление так, как это делает Telegram.
+
+    Для локальной проверки: `python -m bot.webhook http://localhost:8080/webhook`.
+    """
+    from aiohttp import ClientSession
+
+    update = {
+        "update_id": 1,
+        "message": {
+            "message_id": 1,
+            "date": 0,
+            "chat": {"id": chat_id, "type": "private"},
+            "from": {"id": chat_id, "is_bot": False, "first_name": "Test"},
+            "text": text,
+        },
+    }
+    headers = {}
+    if settings.WEBHOOK_SECRET:
+        headers["X-Telegram-Bot-Api-Secret-Token"] = settings.WEBHOOK_SECRET
+    async with ClientSession() as client:
+        async with client.post(url, json=update, headers=headers) as response:
+            logger.info(f"Ответ вебхука: {response.status} {await response.text()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(send_fake_update(*sys.argv[1:]))
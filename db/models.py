@@ -11,6 +11,10 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Time,
+    extract,
+    text,
+    true,
+    JSON,
 )
 
 from db.database import Base
@@ -40,12 +44,22 @@ class User(Base):
         index=True,
     )
     registered_at = Column(DateTime(timezone=True), default=func.now(), index=True)
+    # Сбрасывается, когда Telegram сообщает, что бот заблокирован или чат удалён
+    is_reachable = Column(Boolean, nullable=False, default=True, server_default=true())
     __table_args__ = (
         Index("idx_user_group_registered", "registered_from_group_id", "registered_at"),
         {"schema": "public"},
     )
 
 
+# Индекс под ежедневный поиск именинников по месяцу и дню
+Index(
+    "idx_user_birth_month_day",
+    extract("month", User.birth_date),
+    extract("day", User.birth_date),
+)
+
+
 class Event(Base):
     __tablename__ = "events"
     id = Column(Integer, primary_key=True)
@@ -70,6 +84,10 @@ class Event(Base):
     bartender_task_id = Column(String, nullable=True)
     created_at = Column(DateTime(timezone=True), default=func.now())
     notification_time = Column(DateTime(timezone=True), nullable=True)
+    # Момент начала (event_date + event_time по Москве), для выборок по индексу
+    starts_at = Column(DateTime(timezone=True), nullable=True, index=True)
+    # Поколение расписания: растёт при переносе, устаревшие задачи его сверяют
+    version = Column(Integer, nullable=False, default=1, server_default="1")
     __table_args__ = (
         Index("idx_event_chat_date", "chat_id", "event_date"),
         {"schema": "public"},
@@ -100,3 +118,71 @@ class BeerSelection(Base):
         Index("idx_beer_selection_user_event", "user_id", "event_id", unique=True),
         {"schema": "public"},
     )
+
+
+# Последний выбор пользователя для профиля без сортировки всей истории
+Index(
+    "idx_beer_selection_user_selected",
+    BeerSelection.user_id,
+    BeerSelection.selected_at.desc(),
+)
+
+
+class EventBeerCounter(Base):
+    """Счётчик заказов пива по событию, обновляется вместе с выбором."""
+
+    __tablename__ = "event_beer_counters"
+    event_id = Column(
+        Integer,
+        ForeignKey("public.events.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    beer_choice = Column(String(100), primary_key=True)
+    quantity = Column(Integer, nullable=False, default=0)
+    __table_args__ = ({"schema": "public"},)
+
+
+class BroadcastDelivery(Base):
+    __tablename__ = "broadcast_deliveries"
+    broadcast_id = Column(String(64), primary_key=True)
+    user_id = Column(
+        BigInteger,
+        ForeignKey("public.users.telegram_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    status = Column(String(16), nullable=False)
+    attempts = Column(Integer, nullable=False, default=0)
+    error_code = Column(Integer, nullable=True)
+    updated_at = Column(
+        DateTime(timezone=True), default=func.now(), onupdate=func.now()
+    )
+    __table_args__ = ({"schema": "public"},)
+
+
+class ScheduledJob(Base):
+    """Отложенная задача Celery; отправляется в очередь только в момент due_at."""
+
+    __tablename__ = "scheduled_jobs"
+    id = Column(Integer, primary_key=True)
+    task_name = Column(String(255), nullable=False)
+    args = Column(JSON, nullable=False, default=list)
+    due_at = Column(DateTime(timezone=True), nullable=False)
+    status = Column(String(16), nullable=False, default="pending")
+    # id задачи Celery известен заранее — по нему её можно отозвать
+    task_id = Column(String(64), nullable=False, unique=True)
+    event_id = Column(
+        Integer,
+        ForeignKey("public.events.id", ondelete="CASCADE"),
+        nullable=True,
+        index=True,
+    )
+    created_at = Column(DateTime(timezone=True), default=func.now())
+    enqueued_at = Column(DateTime(timezone=True), nullable=True)
+    __table_args__ = (
+        Index(
+            "idx_scheduled_job_pending_due",
+            "due_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+        {"schema": "public"},
+    )
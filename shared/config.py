@@ -14,6 +14,23 @@ class Settings:
     REDIS_URL = os.getenv("REDIS_URL")
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
     LOG_FILE = os.getenv("LOG_FILE", "bot.log")
+    # "polling" (по умолчанию) или "webhook"
+    BOT_MODE = os.getenv("BOT_MODE", "polling").lower()
+    # Публичный адрес для setWebhook; если пуст, вебхук в Telegram не регистрируется
+    WEBHOOK_URL = os.getenv("WEBHOOK_URL", "")
+    WEBHOOK_PATH = os.getenv("WEBHOOK_PATH", "/webhook")
+    # Обязателен в режиме вебхука; пустая строка считается отсутствием секрета
+    WEBHOOK_SECRET = os.getenv("WEBHOOK_SECRET") or None
+    WEBHOOK_HOST = os.getenv("WEBHOOK_HOST", "0.0.0.0")
+    WEBHOOK_PORT = int(os.getenv("WEBHOOK_PORT", "8080"))
+    WEBHOOK_WORKERS = int(os.getenv("WEBHOOK_WORKERS", "32"))
+    WEBHOOK_QUEUE_SIZE = int(os.getenv("WEBHOOK_QUEUE_SIZE", "1000"))
+    WEBHOOK_DRAIN_TIMEOUT = float(os.getenv("WEBHOOK_DRAIN_TIMEOUT", "25"))
+    # Одновременно обрабатываемых обновлений (держим ниже размера пула БД)
+    HANDLER_CONCURRENCY = int(os.getenv("HANDLER_CONCURRENCY", "25"))
+    # Сколько обновлений может ждать; остальные отбрасываются
+    HANDLER_MAX_WAITING = int(os.getenv("HANDLER_MAX_WAITING", "500"))
+    METRICS_LOG_INTERVAL = float(os.getenv("METRICS_LOG_INTERVAL", "60"))
 
     def get_async_engine(self, loop=None):
         return get_async_engine(loop)
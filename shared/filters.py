@@ -0,0 +1,90 @@
+import random
+import time
+from typing import Optional, Union
+
+from aiogram import Bot
+from aiogram.filters import BaseFilter
+from aiogram.types import CallbackQuery, Chat, Message
+
+# Не чаще одного ответа «не тот чат» в минуту на чат
+REPLY_COOLDOWN = 60
+REPLY_COOLDOWN_MAX_CHATS = 10_000
+
+_last_reply: dict[int, float] = {}
+
+
+def _reply_allowed(chat_id: int) -> bool:
+    now = time.monotonic()
+    last = _last_reply.get(chat_id)
+    if last is not None and now - last < REPLY_COOLDOWN:
+        return False
+    if len(_last_reply) >= REPLY_COOLDOWN_MAX_CHATS:
+        _last_reply.clear()
+    _last_reply[chat_id] = now
+    return True
+
+
+class ChatTypeFilter(BaseFilter):
+    """
+    Пропускает обновление только из чатов заданных типов.
+
+    Указывается последним фильтром обработчика: тогда он проверяется, только
+    если остальные фильтры уже совпали, и обновление отсекается до middleware
+    с сессией БД. Из чужого чата с вероятностью `response_probability` отвечает
+    случайной фразой из `responses`, но не чаще раза в `REPLY_COOLDOWN` секунд на чат.
+    """
+
+    chat_types: tuple[str, ...] = ()
+    default_responses: list[str] = []
+
+    def __init__(
+        self,
+        response_probability: float = 0.5,
+        responses: Optional[list[str]] = None,
+    ):
+        self.response_probability = response_probability
+        self.responses = responses or self.default_responses
+
+    async def __call__(self, event: Union[Message, CallbackQuery], bot: Bot) -> bool:
+        chat = self._get_chat(event)
+        if chat is None or chat.type in self.chat_types:
+            return True
+        if isinstance(event, CallbackQuery):
+            await event.answer()
+        if (
+            self.responses
+            and random.random() < self.response_probability
+            and _reply_allowed(chat.id)
+        ):
+            await bot.send_message(chat_id=chat.id, text=random.choice(self.responses))
+        return False
+
+    @staticmethod
+    def _get_chat(event: Union[Message, CallbackQuery]) -> Optional[Chat]:
+        if isinstance(event, Message):
+            return event.chat
+        if isinstance(event, CallbackQuery) and event.message:
+            return event.message.chat
+        return None
+
+
+class PrivateChatOnly(ChatTypeFilter):
+    """Разрешает обработчик только в личных сообщениях."""
+
+    chat_types = ("private",)
+    default_responses = [
+        "Эта команда работает только в личных сообщениях! 😊",
+        "Пожалуйста, используй меня в приватном чате. 🙏",
+        "Я не работаю в группах, напиши мне в личку! ✉️",
+    ]
+
+
+class GroupChatOnly(ChatTypeFilter):
+    """Разрешает обработчик только в группах и каналах."""
+
+    chat_types = ("group", "supergroup", "channel")
+    default_responses = [
+        "Эта команда работает только в группах или каналах! 😊",
+        "Пожалуйста, используй меня в группе. 🙏",
+        "Я не работаю в личных сообщениях, добавь меня в группу! 👥",
+    ]
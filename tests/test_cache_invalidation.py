@@ -0,0 +1,91 @@
+import asyncio
+import json
+
+from bot.core import cache
+
+
+class FakePubSub:
+    def __init__(self, redis):
+        self.redis = redis
+        self.queue = asyncio.Queue()
+
+    async def subscribe(self, channel):
+        self.redis.subscribers.setdefault(channel, []).append(self.queue)
+
+    async def listen(self):
+        while True:
+            yield await self.queue.get()
+
+    async def aclose(self):
+        pass
+
+
+class FakeRedis:
+    """Минимальный Redis в памяти: delete, publish и pub/sub."""
+
+    def __init__(self):
+        self.subscribers = {}
+        self.published = []
+
+    async def delete(self, *keys):
+        return len(keys)
+
+    async def publish(self, channel, data):
+        self.published.append((channel, data))
+        for queue in self.subscribers.get(channel, []):
+            queue.put_nowait({"type": "message", "data": data})
+        return len(self.subscribers.get(channel, []))
+
+    def pubsub(self):
+        return FakePubSub(self)
+
+
+def run_with_listener(monkeypatch, scenario):
+    redis = FakeRedis()
+    monkeypatch.setattr(cache, "get_redis", lambda: redis)
+
+    async def main():
+        listener = asyncio.create_task(cache.listen_invalidations())
+        await asyncio.sleep(0)
+        try:
+            await scenario(redis)
+        finally:
+            listener.cancel()
+
+    asyncio.run(main())
+    return redis
+
+
+def test_two_tier_cache_invalidation_reaches_subscribers(monkeypatch):
+    test_cache = cache.TwoTierCache("test_two_tier")
+
+    async def scenario(redis):
+        await test_cache.invalidate("a", "b")
+        # Значение, которое другой процесс держит в памяти, пока не пришло сообщение
+        test_cache._set_local("a", 1)
+        await asyncio.sleep(0.01)
+        assert test_cache._get_local("a") is cache._MISSING
+
+    redis = run_with_listener(monkeypatch, scenario)
+    assert [(channel, json.loads(data)) for channel, data in redis.published] == [
+        (
+            cache.INVALIDATION_CHANNEL,
+            {"namespace": "test_two_tier", "keys": ["a", "b"]},
+        )
+    ]
+
+
+def test_snapshot_invalidation_reaches_subscribers(monkeypatch):
+    snapshot = cache.LocalSnapshot("test_snapshot", ttl=60)
+
+    async def scenario(redis):
+        await snapshot.invalidate()
+        assert await snapshot.get(lambda: asyncio.sleep(0, result=1)) == 1
+        await asyncio.sleep(0.01)
+        assert await snapshot.get(lambda: asyncio.sleep(0, result=2)) == 2
+
+    redis = run_with_listener(monkeypatch, scenario)
+    assert json.loads(redis.published[0][1]) == {
+        "namespace": "test_snapshot",
+        "keys": [],
+    }
@@ -0,0 +1,36 @@
+import pytest
+
+from bot.tasks.celery_app import QUEUE_NAMES, app
+
+ROUTED_TASKS = {
+    "bot.tasks.bartender_notification.process_bartender_notification": "realtime",
+    "bot.tasks.scheduler.dispatch_due_jobs": "realtime",
+    "bot.tasks.bartender_notification.process_user_notification": "broadcast",
+    "bot.tasks.bartender_notification.send_user_notification_chunk": "broadcast",
+    "bot.tasks.birthday_notification.process_birthday_notifications": "default",
+    "bot.tasks.maintenance.reconcile_beer_counters": "default",
+}
+
+
+def receiving_queues(task_name: str) -> set[str]:
+    """Очереди, которые брокер выберет для задачи по обменнику и ключу (direct)."""
+    target = app.amqp.router.route({}, task_name)["queue"]
+    return {
+        name
+        for name, queue in app.amqp.queues.items()
+        if queue.exchange.name == target.exchange.name
+        and queue.routing_key == target.routing_key
+    }
+
+
+@pytest.mark.parametrize("task_name, expected", ROUTED_TASKS.items())
+def test_task_lands_only_in_its_queue(task_name, expected):
+    assert receiving_queues(task_name) == {expected}
+
+
+def test_queues_have_distinct_bindings():
+    bindings = {
+        (queue.exchange.name, queue.routing_key) for queue in app.amqp.queues.values()
+    }
+    assert set(app.amqp.queues) == set(QUEUE_NAMES)
+    assert len(bindings) == len(QUEUE_NAMES)